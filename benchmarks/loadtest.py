@@ -0,0 +1,215 @@
+"""Headless load test: N sessions clicking through the dashboard, reruns serialized.
+
+Every simulated session is a Streamlit ``AppTest`` of main.py running in its
+own thread of this one process, sharing the process's caches the way one
+Streamlit worker's browser tabs do, but without a browser or network.
+AppTest swaps process-wide runtime state on every run, so runs can't
+overlap: each rerun holds a lock while it runs. The harness therefore does
+not measure concurrent execution or contention inside the app. It measures
+how the sessions' reruns behave when executed one at a time against shared
+caches, and it reports the two parts of each rerun's latency separately:
+
+- service time: time spent running the rerun, with the lock held. This is
+  the app's own cost, and what to compare between changes.
+- wait time: time spent queued for the lock behind the other sessions'
+  reruns. It grows with the session count by construction, and only says
+  how deep the queue was.
+
+Each session visits the six pages in turn and changes one selector on each,
+repeating the tour ``--rounds`` times. For every session count the harness
+reports service and wait percentiles, throughput, process CPU time and peak
+RSS::
+
+    python benchmarks/loadtest.py --sessions 1,2,4,8 --rounds 2
+    python benchmarks/loadtest.py --json loadtest.json
+
+Notes on reading the numbers: sessions share the process's caches, so the
+first session count also pays for building the datasets and figures (use
+--warmup to exclude that); AppTest reruns the whole page when a widget inside
+a fragment changes, so selector latencies are an upper bound; and peak RSS is
+the process's high-water mark, which only grows from one session count to the
+next.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import threading
+import time
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_SCRIPT = os.path.join(ROOT, "main.py")
+
+# AppTest installs and removes a process-wide mock runtime around every run
+_RUN_LOCK = threading.Lock()
+
+SEARCH_TERMS = ["2081", "Baisakh", "2081 Shrawan", "2024-07", "End Date", "Jestha 2nd Week"]
+
+
+def _widget(elements, label: str):
+    return next(element for element in elements if element.label == label)
+
+
+def _pick(rng: random.Random, options: list, current=None):
+    choices = [option for option in options if option != current] or options
+    return rng.choice(choices)
+
+
+# (step name, page script or None to stay on the page, selector action)
+def _tour(rng: random.Random) -> list:
+    return [
+        ("home: range", None, lambda at: _widget(at.selectbox, "From Year").select(
+            _pick(rng, _widget(at.selectbox, "From Year").options))),
+        ("search", "views/search.py", None),
+        ("search: query", None, lambda at: at.text_input[0].input(rng.choice(SEARCH_TERMS))),
+        ("weekly", "views/weekly.py", None),
+        ("weekly: slider", None, lambda at: at.slider[0].set_value(rng.randint(1, at.slider[0].max))),
+        ("monthly", "views/monthly.py", None),
+        ("monthly: fiscal year", None, lambda at: _widget(at.selectbox, "Select Fiscal Year for Bar Chart").select(
+            _pick(rng, _widget(at.selectbox, "Select Fiscal Year for Bar Chart").options))),
+        ("bankwise", "views/bankwise.py", None),
+        ("bankwise: banks", None, lambda at: _widget(at.multiselect, "Choose a bank").select(
+            _pick(rng, _widget(at.multiselect, "Choose a bank").options))),
+        ("cd ratio", "views/cd_ratio.py", None),
+        ("cd ratio: fiscal year", None, lambda at: at.selectbox[0].select(
+            _pick(rng, at.selectbox[0].options, at.selectbox[0].value))),
+        ("home", "views/home.py", None),
+    ]
+
+
+def run_session(seed: int, rounds: int, start: threading.Barrier, latencies: list, errors: list) -> None:
+    """One simulated user: ``rounds`` tours of every page.
+
+    Appends ``(step, wait s, service s)`` to ``latencies`` for each rerun.
+    """
+    rng = random.Random(seed)
+    at = AppTest.from_file(MAIN_SCRIPT, default_timeout=300)
+    start.wait()
+
+    def timed_run(step):
+        t = time.perf_counter()
+        with _RUN_LOCK:
+            wait = time.perf_counter() - t
+            at.run()
+        latencies.append((step, wait, time.perf_counter() - t - wait))
+        if at.exception:
+            errors.append(f"{step}: {at.exception[0].message}")
+
+    try:
+        timed_run("start")
+        for _ in range(rounds):
+            for step, page, action in _tour(rng):
+                if page is not None:
+                    at.switch_page(page)
+                if action is not None:
+                    action(at)
+                timed_run(step)
+    except Exception as e:
+        errors.append(f"session {seed}: {e!r}")
+
+
+def _rss_mb() -> float:
+    """Current resident set size in MB, or NaN where /proc isn't available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return float("nan")
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def run_level(sessions: int, rounds: int, seed: int) -> dict:
+    """Run ``sessions`` sessions side by side and summarize their (serialized) reruns."""
+    latencies, errors = [], []
+    start = threading.Barrier(sessions + 1)
+    threads = [
+        threading.Thread(target=run_session, args=(seed + i, rounds, start, latencies, errors), daemon=True)
+        for i in range(sessions)
+    ]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    wall, cpu = time.perf_counter(), time.process_time()
+    for thread in threads:
+        thread.join()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+    waits = np.array([wait for _, wait, _ in latencies]) * 1000
+    services = np.array([service for _, _, service in latencies]) * 1000
+
+    def percentiles(times):
+        values = np.percentile(times, [50, 95, 99]) if len(times) else (np.nan,) * 3
+        return [round(float(v), 1) for v in values]
+
+    service_p50, service_p95, service_p99 = percentiles(services)
+    wait_p50, wait_p95, wait_p99 = percentiles(waits)
+    return {
+        "sessions": sessions,
+        "reruns": len(services),
+        "errors": errors,
+        "service_p50_ms": service_p50,
+        "service_p95_ms": service_p95,
+        "service_p99_ms": service_p99,
+        "wait_p50_ms": wait_p50,
+        "wait_p95_ms": wait_p95,
+        "wait_p99_ms": wait_p99,
+        "reruns_per_s": round(len(services) / wall, 2),
+        "wall_s": round(wall, 2),
+        "cpu_s": round(cpu, 2),
+        "cpu_ms_per_rerun": round(cpu * 1000 / max(len(services), 1), 1),
+        "rss_mb": round(_rss_mb(), 1),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        # Median service time per step
+        "steps": {
+            step: round(float(np.median([t for s, _, t in latencies if s == step])) * 1000, 1)
+            for step in dict.fromkeys(step for step, _, _ in latencies)
+        },
+    }
+
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python benchmarks/loadtest.py", description="Multi-session load test with serialized reruns.")
+    parser.add_argument("--sessions", default="1,2,4,8", help="comma-separated session counts")
+    parser.add_argument("--rounds", type=int, default=2, help="page tours per session")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the selector choices")
+    parser.add_argument("--warmup", action="store_true", help="run one untimed session first to fill the caches")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv[1:])
+
+    # The app opens Schema.csv, logo.png etc. relative to the repository root
+    os.chdir(ROOT)
+    if args.warmup:
+        run_level(1, 1, args.seed)
+
+    results = []
+    print("Reruns are serialized; service = time running a rerun, wait = time queued behind other sessions")
+    print(f"{'sessions':>8} {'reruns':>7} {'service p50':>12} {'p95':>7} {'p99':>7} {'wait p50':>9} {'p95':>7} "
+          f"{'reruns/s':>9} {'CPU s':>7} {'CPU ms/rerun':>13} {'peak RSS MB':>12} {'errors':>7}")
+    for sessions in (int(s) for s in args.sessions.split(",")):
+        result = run_level(sessions, args.rounds, args.seed)
+        results.append(result)
+        print(f"{sessions:>8} {result['reruns']:>7} {result['service_p50_ms']:>12} {result['service_p95_ms']:>7} "
+              f"{result['service_p99_ms']:>7} {result['wait_p50_ms']:>9} {result['wait_p95_ms']:>7} {result['reruns_per_s']:>9} {result['cpu_s']:>7} {result['cpu_ms_per_rerun']:>13} "
+              f"{result['peak_rss_mb']:>12} {len(result['errors']):>7}")
+        for error in result["errors"][:5]:
+            print(f"    {error}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"rounds": args.rounds, "seed": args.seed, "results": results}, f, indent=2)
+            f.write("\n")
+    return 1 if any(result["errors"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
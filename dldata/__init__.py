@@ -0,0 +1,27 @@
+"""Headless data layer for the NBA DL Data dashboard.
+
+Everything here is plain pandas and can be imported, profiled or reused
+without starting Streamlit; main.py only renders what these functions return.
+"""
+from dldata.cube import Cube, build_cube
+from dldata.matrix import BankMatrix
+from dldata.pipeline import build, data_source, load_data, source_version
+from dldata.schema import DATA_FILE, MEASURE_COLUMNS, SUMMED_COLUMNS
+from dldata.search import SearchIndex
+from dldata.source import data_version, read_csv
+
+__all__ = [
+    "BankMatrix",
+    "Cube",
+    "DATA_FILE",
+    "MEASURE_COLUMNS",
+    "SUMMED_COLUMNS",
+    "SearchIndex",
+    "build",
+    "build_cube",
+    "data_source",
+    "data_version",
+    "load_data",
+    "read_csv",
+    "source_version",
+]
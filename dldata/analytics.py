@@ -0,0 +1,124 @@
+"""Rolling, year-over-year and fiscal-year-to-date measures of month-end frames.
+
+``month_analytics`` adds, for each of ``columns`` (DTOTAL, LTOTAL and CD by
+default), the columns
+
+    <column> Change, <column> Change %     change since the previous month
+    <column> FYTD, <column> FYTD %         change since the close of the previous FY
+    <column> YoY, <column> YoY %           change since the same month of the previous FY
+    <column> 3M Avg, <column> 12M Avg      average over the last 3 / 12 months
+
+The first month of a FY is compared with the last month of the FY before it,
+so FYTD includes the first month's growth and equals YoY at the last month.
+Only the first FY of a group, with nothing before it, has no Change or FYTD.
+Passing ``group="Bank"`` computes the same columns for every bank of a
+per-bank frame at once.
+
+Everything comes from one sort of the rows by group and period, after which
+the FYTD base is the row before each FY's first month, the rolling measures
+are differences of grouped cumulative sums and the year-over-year lookup is a
+binary search for each row's period key minus 1000, so the cost is the same
+for the totals and for every bank.
+The result is built once per data version and shared, like the cube.
+"""
+import numpy as np
+import pandas as pd
+
+from dldata.schema import SUMMED_COLUMNS
+from dldata.timing import timed
+
+ANALYTICS_COLUMNS = ["DTOTAL", "LTOTAL", "CD"]
+ROLLING_MONTHS = (3, 12)
+
+# Period keys of the same month in consecutive fiscal years differ by this
+_FISCAL_YEAR_KEYS = 1000
+# Above any period key, so group and key pack into one sortable integer
+_GROUP_STRIDE = 10 ** 7
+
+
+def _starts(new_group: np.ndarray) -> np.ndarray:
+    """Position of the first row of each row's group, for rows sorted by group."""
+    return np.maximum.accumulate(np.where(new_group, np.arange(len(new_group)), 0))
+
+
+def _cumsum(values: np.ndarray) -> np.ndarray:
+    """Column-wise cumulative sum with a leading row of zeros, ignoring NaN."""
+    sums = np.zeros((len(values) + 1, values.shape[1]))
+    np.cumsum(np.nan_to_num(values), axis=0, out=sums[1:])
+    return sums
+
+
+@timed
+def month_analytics(frame: pd.DataFrame, columns: list = ANALYTICS_COLUMNS, group: str = None,
+                    windows: tuple = ROLLING_MONTHS) -> pd.DataFrame:
+    """``frame`` with the analytics columns added, in ``frame``'s row order.
+
+    ``frame`` holds one month-end row per period (per ``group`` value if
+    given) with a ``Period`` key column, like the cube's ``months`` and
+    ``bank_months``.
+    """
+    n = len(frame)
+    keys = frame["Period"].to_numpy(dtype=np.int64)
+    groups = pd.factorize(frame[group])[0] if group else np.zeros(n, dtype=np.int64)
+    order = np.lexsort((keys, groups))
+    keys, groups = keys[order], groups[order]
+    values = frame[list(columns)].to_numpy(dtype="float64")[order]
+
+    new_group = np.ones(n, dtype=bool)
+    new_group[1:] = groups[1:] != groups[:-1]
+    new_fy = new_group.copy()
+    new_fy[1:] |= keys[1:] // _FISCAL_YEAR_KEYS != keys[:-1] // _FISCAL_YEAR_KEYS
+
+    # The previous month within the group, across FY boundaries
+    previous = np.full_like(values, np.nan)
+    previous[1:] = values[:-1]
+    previous[new_group] = np.nan
+    change = values - previous
+
+    # FYTD: the change since the previous FY's last month, which is the
+    # previous row of the FY's first month
+    fy_base = previous[_starts(new_fy)]
+    fytd = values - fy_base
+
+    # Same month of the previous FY, looked up by group and period key
+    combined = groups * _GROUP_STRIDE + keys
+    target = combined - _FISCAL_YEAR_KEYS
+    position = np.minimum(np.searchsorted(combined, target), max(n - 1, 0))
+    found = combined[position] == target
+    last_year = np.where(found[:, None], values[position], np.nan)
+    yoy = values - last_year
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        results = {
+            "Change": change,
+            "Change %": change / previous * 100,
+            "FYTD": fytd,
+            "FYTD %": fytd / fy_base * 100,
+            "YoY": yoy,
+            "YoY %": yoy / last_year * 100,
+        }
+
+        # Rolling averages over full windows of reported months within the group
+        level_sums = _cumsum(values)
+        counts = _cumsum(~np.isnan(values))
+        group_start = _starts(new_group)
+        end = np.arange(1, n + 1)
+        for window in windows:
+            begin = end - window
+            full = begin >= group_start
+            begin = np.maximum(begin, 0)
+            average = (level_sums[end] - level_sums[begin]) / (counts[end] - counts[begin])
+            results[f"{window}M Avg"] = np.where(full[:, None], average, np.nan)
+
+    # Back to the frame's row order
+    inverse = np.empty_like(order)
+    inverse[order] = np.arange(n)
+    added = {}
+    for suffix, result in results.items():
+        for i, column in enumerate(columns):
+            column_values = result[inverse, i]
+            if column in SUMMED_COLUMNS and not suffix.endswith("%"):
+                # Amounts carry two decimals
+                column_values = column_values.round(2)
+            added[f"{column} {suffix}"] = column_values
+    return frame.assign(**added)
@@ -0,0 +1,229 @@
+"""Per-stage micro-benchmarks of the data pipeline.
+
+Times every stage from CSV parsing through the rollups to the page-level
+derivations and the Arrow serialization ``st.dataframe`` performs, on the real
+Schema.csv and on synthetic data scaled 10x and 100x (see ``dldata.synthetic``).
+Run from the repository root::
+
+    python -m dldata.bench                 # compare against the baseline
+    python -m dldata.bench --save          # record a new baseline
+    python -m dldata.bench --scales 1,10   # skip the 100x dataset
+
+The whole pipeline is run ``--repeats`` times over, so a burst of load on
+the machine lands on one pass rather than on every run of one stage. Each
+pass records a stage's median time, and the stage's time is the median of
+those pass medians; their spread is kept as the stage's noise.
+
+A stage regresses when its median is more than ``threshold`` times the
+baseline median and slower by more than its noise floor: the larger of
+``min_delta_ms`` and ``NOISE_FACTOR`` times the noise recorded with the
+baseline. Any regression makes the run exit with status 1, and so does a
+stage missing from the baseline, since it would go ungated: re-record the
+baseline with ``--save`` whenever a stage is added. Baselines are
+machine-specific, so record one on the machine that runs the comparison.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from dldata import analytics, cube, derive, downsample, snapshot, synthetic, validate
+from dldata.matrix import BankMatrix
+from dldata.schema import DATA_FILE, MEASURE_COLUMNS
+from dldata.search import SearchIndex
+from dldata.source import data_version, read_csv
+
+BASELINE_FILE = os.path.join("benchmarks", "baseline.json")
+BASELINE_FORMAT = 2
+
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 1.5
+DEFAULT_MIN_DELTA_MS = 2.0
+# Regressions must exceed this many times the baseline's pass-to-pass spread
+NOISE_FACTOR = 2.0
+
+# Columns a weekly table page shows, as views/weekly.py projects them
+TABLE_COLUMNS = ["FY", "Year", "Month", "Week", "Date", "Ndate", "DTOTAL", "LTOTAL", "CD", "DTOTAL Growth", "LTOTAL Growth"]
+
+
+def measure(fn, min_time: float = 0.1, min_runs: int = 3, max_runs: int = 50) -> list:
+    """Run ``fn`` until ``min_time`` has passed and return its timings in milliseconds."""
+    times = []
+    started = time.perf_counter()
+    while len(times) < min_runs or (time.perf_counter() - started < min_time and len(times) < max_runs):
+        t = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t) * 1000)
+    return times
+
+
+def summarize(passes: list) -> dict:
+    """A stage's timing from the run times of each pass."""
+    medians = [statistics.median(times) for times in passes]
+    return {
+        "median_ms": round(statistics.median(medians), 4),
+        "min_ms": round(min(min(times) for times in passes), 4),
+        "noise_ms": round(max(medians) - min(medians), 4),
+        "repeats": len(passes),
+    }
+
+
+def _dataset_csv(scale: int, workdir: str) -> str:
+    if scale == 1:
+        return DATA_FILE
+    path = os.path.join(workdir, f"synthetic-{scale}.csv")
+    synthetic.write_csv(synthetic.synthetic_schema(scale), path)
+    return path
+
+
+def _regressed(current: dict, base: dict, threshold: float, min_delta: float) -> bool:
+    noise_floor = max(min_delta, NOISE_FACTOR * base["noise_ms"])
+    return (current["median_ms"] > base["median_ms"] * threshold
+            and current["median_ms"] - base["median_ms"] > noise_floor)
+
+
+def run_stages(csv_path: str, workdir: str, repeats: int = DEFAULT_REPEATS) -> dict:
+    """Timings of every pipeline stage on one dataset, over ``repeats`` passes."""
+    passes = {}
+    for _ in range(repeats):
+        rows = _run_pass(csv_path, workdir, passes)
+    results = {name: summarize(times) for name, times in passes.items()}
+    results["_rows"] = rows
+    return results
+
+
+def _run_pass(csv_path: str, workdir: str, passes: dict) -> dict:
+    """Time every stage once, appending its run times to ``passes[stage]``."""
+    import pyarrow as pa
+
+    def stage(name, fn):
+        passes.setdefault(name, []).append(measure(fn))
+        return fn()
+
+    version = data_version(csv_path)
+    snapshot_path = os.path.join(workdir, "bench.feather")
+    df = stage("read_csv", lambda: read_csv(csv_path))
+    stage("snapshot_write", lambda: snapshot.write_snapshot(df, version, snapshot_path))
+    stage("snapshot_read", lambda: snapshot.read_snapshot(version, snapshot_path))
+    stage("validate", lambda: validate.check(df))
+
+    banks = stage("build_banks", lambda: cube.build_banks(cube.cd_percent(df)))
+    periods = stage("build_periods", lambda: cube.build_periods(banks))
+    months = stage("build_months", lambda: cube.build_months(periods))
+    weeks = stage("build_weeks", lambda: cube.build_weeks(periods))
+    bank_months = stage("build_bank_months", lambda: cube.build_bank_months(banks))
+    stage("build_fiscal_years", lambda: cube.build_fiscal_years(months))
+    matrix = stage("build_bank_matrix", lambda: BankMatrix.build(bank_months))
+    stage("month_analytics", lambda: analytics.month_analytics(months))
+    stage("bank_month_analytics", lambda: analytics.month_analytics(bank_months, group="Bank"))
+
+    index = stage("search_index", lambda: SearchIndex.build(periods))
+    stage("search_query", lambda: index.search("2081 Baisakh"))
+
+    keys = bank_months["Period"].to_numpy()
+    stage("select_range", lambda: derive.select_range(bank_months, int(keys[0]), int(keys[-1])))
+    stage("compare_range", lambda: derive.compare_range(periods, MEASURE_COLUMNS))
+    page = stage("growth_window", lambda: derive.growth_window(weeks, slice(-52, None)))
+    stage("growth_long", lambda: derive.growth_long(page, "Description"))
+    stage("bank_history", lambda: matrix.bank_frame(matrix.banks[0]))
+    stage("bank_market_share", lambda: matrix.market_share("DTOTAL"))
+    stage("bank_range_change", lambda: matrix.range_change(slice(0, None)))
+    history = bank_months[bank_months["Bank"] == bank_months["Bank"].iloc[0]]["DTOTAL"].to_numpy()
+    series = np.tile(history, max(1, 20000 // len(history)))
+    stage("lttb_downsample", lambda: downsample.lttb(np.arange(len(series)), series, 500))
+
+    # What st.dataframe does with a projected table page and a bank's full history
+    stage("serialize_page", lambda: pa.Table.from_pandas(page[TABLE_COLUMNS], preserve_index=False))
+    bank = bank_months[bank_months["Bank"] == bank_months["Bank"].iloc[0]]
+    stage("serialize_bank_history", lambda: pa.Table.from_pandas(bank, preserve_index=False))
+
+    return {"banks": len(banks), "periods": len(periods)}
+
+
+def compare(results: dict, baseline: dict) -> tuple:
+    """``(regressions, ungated)``: ``(dataset, stage, baseline ms, current ms)``
+    for every regressed stage, and ``(dataset, stage)`` for stages the
+    baseline doesn't have."""
+    threshold = baseline.get("threshold", DEFAULT_THRESHOLD)
+    min_delta = baseline.get("min_delta_ms", DEFAULT_MIN_DELTA_MS)
+    regressions, ungated = [], []
+    for dataset, stages in results.items():
+        for name, timing in stages.items():
+            if name.startswith("_"):
+                continue
+            base = baseline["results"].get(dataset, {}).get(name)
+            if base is None:
+                ungated.append((dataset, name))
+            elif _regressed(timing, base, threshold, min_delta):
+                regressions.append((dataset, name, base["median_ms"], timing["median_ms"]))
+    return regressions, ungated
+
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python -m dldata.bench", description="Time each data pipeline stage.")
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)), help="comma-separated dataset scales; 1 is the real Schema.csv")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="passes over the whole pipeline")
+    parser.add_argument("--threshold", type=float, default=None, help="allowed slowdown factor (default: the baseline's)")
+    args = parser.parse_args(argv[1:])
+
+    baseline = None
+    if not args.save and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("format") != BASELINE_FORMAT:
+            print(f"{args.baseline} uses baseline format {baseline.get('format')!r}, expected {BASELINE_FORMAT}; record a new one with --save")
+            return 1
+        if args.threshold:
+            baseline["threshold"] = args.threshold
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in (int(s) for s in args.scales.split(",")):
+            dataset = "real" if scale == 1 else f"x{scale}"
+            results[dataset] = run_stages(_dataset_csv(scale, workdir), workdir, args.repeats)
+            rows = results[dataset]["_rows"]
+            print(f"{dataset}: {rows['banks']} bank rows, {rows['periods']} periods")
+            for name, timing in results[dataset].items():
+                if not name.startswith("_"):
+                    print(f"  {name:<24} {timing['median_ms']:10.3f} ms  (min {timing['min_ms']:.3f}, noise {timing['noise_ms']:.3f}, {timing['repeats']} passes)")
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        baseline = {
+            "format": BASELINE_FORMAT,
+            "threshold": args.threshold or DEFAULT_THRESHOLD,
+            "min_delta_ms": DEFAULT_MIN_DELTA_MS,
+            "machine": {"python": platform.python_version(), "platform": platform.platform(), "numpy": np.__version__},
+            "results": results,
+        }
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Wrote {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; record one with --save")
+        return 0
+    regressions, ungated = compare(results, baseline)
+    for dataset, name, previous, current in regressions:
+        print(f"REGRESSION {dataset}/{name}: median {previous:.3f} ms -> {current:.3f} ms ({current / previous:.2f}x)")
+    for dataset, name in ungated:
+        print(f"UNGATED {dataset}/{name}: not in {args.baseline}; record a new baseline with --save")
+    if regressions or ungated:
+        return 1
+    print(f"No stage slower than {baseline.get('threshold', DEFAULT_THRESHOLD)}x its baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,106 @@
+"""Materialized rollups of the per-bank schema frame.
+
+The cube is built once per data version and shared by every page and session,
+so its frames must be treated as read-only: pages filter or copy them, never
+assign into them. Each frame also has its own ``build_*`` step so the dashboard
+can build only the frames a page uses.
+"""
+from typing import NamedTuple
+
+import pandas as pd
+
+from dldata.derive import growth
+from dldata.nepali_calendar import parse_ndate
+from dldata.periods import UNKNOWN_PERIOD, period_keys
+from dldata.schema import SUMMED_COLUMNS, TOTAL_PARTS
+from dldata.timing import timed
+
+
+class Cube(NamedTuple):
+    banks: pd.DataFrame         # per-bank rows as loaded, in period order
+    periods: pd.DataFrame       # industry totals per Year/Month/Week, in period order
+    months: pd.DataFrame        # month-end rows of periods
+    weeks: pd.DataFrame         # weekly rows of periods, with week-on-week growth
+    bank_months: pd.DataFrame   # month-end rows of banks
+    fiscal_years: pd.DataFrame  # one row per FY with closing totals and CD ratio
+
+
+def cd_percent(df: pd.DataFrame) -> pd.DataFrame:
+    """Schema rows with the CD ratio expressed as a percentage."""
+    return df.assign(CD=df["CD"] * 100)
+
+
+@timed
+def build_periods(df: pd.DataFrame) -> pd.DataFrame:
+    # Sum in float64 so the per-period totals don't pick up float32 error
+    df = df.astype({c: "float64" for c in SUMMED_COLUMNS})
+    periods = df.groupby(['Year', 'Month', 'Week'], observed=True).agg({
+        'DLCY': 'sum', 'DFCY': 'sum', 'DTOTAL': 'sum',
+        'LLCY': 'sum', 'LFCY': 'sum', 'LTOTAL': 'sum', 'CD': 'mean',
+        'type': 'first', 'Date': 'first', 'Ndate': 'first', 'FY': 'first'
+    }).reset_index()
+
+    # Totals come from their parts, as reported totals don't always match them
+    # (see the "total mismatch" check in dldata.validate)
+    for total, parts in TOTAL_PARTS:
+        periods[total] = periods[parts].sum(axis=1)
+    periods['Description'] = periods['Year'].astype(str) + ' ' + periods['Month'].astype(str) + ' ' + periods['Week'].astype(str)
+    periods[SUMMED_COLUMNS] = periods[SUMMED_COLUMNS].round(2)
+    periods['Long Date'] = periods['Date'].dt.strftime('%B %d, %Y')
+    periods['Period'] = period_keys(periods)
+    periods = periods.join(parse_ndate(periods['Ndate']))
+    return periods.sort_values(by="Period").reset_index(drop=True)
+
+
+@timed
+def build_fiscal_years(months: pd.DataFrame) -> pd.DataFrame:
+    fiscal_years = months.groupby('FY', observed=True, sort=False).agg(
+        Months=('Month', 'size'),
+        From=('Date', 'first'),
+        To=('Date', 'last'),
+        DTOTAL=('DTOTAL', 'last'),
+        LTOTAL=('LTOTAL', 'last'),
+        CD=('CD', 'last'),
+        **{'Average CD': ('CD', 'mean')},
+    ).reset_index()
+    return growth(fiscal_years)
+
+
+@timed
+def build_banks(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.assign(Period=period_keys(df))
+    # Rows without a known period are reported as "unknown label" by dldata.validate
+    df = df[df["Period"] != UNKNOWN_PERIOD].sort_values(by="Period", kind="stable", ignore_index=True)
+    return df.join(parse_ndate(df['Ndate']))
+
+
+@timed
+def build_months(periods: pd.DataFrame) -> pd.DataFrame:
+    months = periods[periods["type"] == "End"]
+    return months.assign(Yearmonth=months["Year"].astype(str) + "-" + months["Month"].astype(str))
+
+
+@timed
+def build_weeks(periods: pd.DataFrame) -> pd.DataFrame:
+    # Growth columns are added by the pages, for the rows they show
+    return periods[periods["type"] == "Week"]
+
+
+@timed
+def build_bank_months(banks: pd.DataFrame) -> pd.DataFrame:
+    bank_months = banks[banks["type"] == "End"]
+    return bank_months.assign(ChartDate=bank_months['Year'].astype(str) + '-' + bank_months['Month'].astype(str))
+
+
+def build_cube(df: pd.DataFrame) -> Cube:
+    banks = build_banks(df)
+    periods = build_periods(banks)
+    months = build_months(periods)
+    return Cube(
+        banks=banks,
+        periods=periods,
+        months=months,
+        weeks=build_weeks(periods),
+        bank_months=build_bank_months(banks),
+        fiscal_years=build_fiscal_years(months),
+    )
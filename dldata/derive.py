@@ -0,0 +1,76 @@
+"""Page-level derivations on the cube's frames.
+
+Every function returns a new frame (or a slice of its input) and never assigns
+into the frames it is given, so they are safe to call on the shared cube.
+Derivations that don't depend on a page's selections, like the monthly
+analytics in ``dldata.analytics``, are computed once per data version by the
+dashboard's dataset cache.
+"""
+import pandas as pd
+
+from dldata.periods import key_slice
+from dldata.timing import timed
+
+GROWTH_LABELS = {
+    'DTOTAL Growth': 'Deposit Growth',
+    'LTOTAL Growth': 'Lending Growth',
+}
+
+# The same labels for the month-on-month changes of ``dldata.analytics``
+CHANGE_LABELS = {
+    'DTOTAL Change': 'Deposit Growth',
+    'LTOTAL Change': 'Lending Growth',
+}
+
+
+@timed
+def select_range(frame: pd.DataFrame, start_key: int, end_key: int) -> pd.DataFrame:
+    """Rows whose period key lies between ``start_key`` and ``end_key``.
+
+    ``frame`` must be sorted by its ``Period`` column, as the cube's frames are.
+    """
+    return frame.iloc[key_slice(frame['Period'].to_numpy(), start_key, end_key)]
+
+
+@timed
+def compare_range(frame: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """Start, end and change of ``columns`` between the first and last row."""
+    start = frame[columns].iloc[0]
+    end = frame[columns].iloc[-1]
+    return pd.DataFrame({
+        "Start": start,
+        "End": end,
+        "Change": end - start,
+        "Change %": (end - start) / start * 100,
+    })
+
+
+@timed
+def growth(frame: pd.DataFrame, columns: list = ('DTOTAL', 'LTOTAL'), pct: bool = False) -> pd.DataFrame:
+    """Add ``<column> Growth`` as the row-on-row change (or % change) of each column.
+
+    Amounts carry two decimals, so changes are rounded to two decimals too
+    rather than keeping the float error of the subtraction.
+    """
+    if pct:
+        return frame.assign(**{f"{c} Growth": frame[c].pct_change() * 100 for c in columns})
+    return frame.assign(**{f"{c} Growth": frame[c].diff().round(2) for c in columns})
+
+
+@timed
+def growth_window(frame: pd.DataFrame, rows: slice, columns: list = ('DTOTAL', 'LTOTAL'), pct: bool = False) -> pd.DataFrame:
+    """``growth`` for ``frame.iloc[rows]`` only, measured from the row before the window."""
+    start, stop, _ = rows.indices(len(frame))
+    base = max(start - 1, 0)
+    return growth(frame.iloc[base:stop], columns, pct).iloc[start - base:]
+
+
+@timed
+def growth_long(frame: pd.DataFrame, id_col: str, labels: dict = GROWTH_LABELS) -> pd.DataFrame:
+    """Deposit and lending growth in long form for grouped bar charts.
+
+    ``labels`` maps the growth columns to melt to their labels.
+    """
+    # Label the columns before melting instead of relabelling every melted row
+    labelled = frame[[id_col, *labels]].rename(columns=labels)
+    return labelled.melt(id_vars=id_col, var_name='Total Type', value_name='Growth')
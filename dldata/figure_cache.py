@@ -0,0 +1,60 @@
+"""Bounded LRU cache for built Plotly figures.
+
+Figures are keyed by ``(data version, chart id, selection parameters)`` so a
+rerun that doesn't change a chart's inputs reuses the figure instead of going
+through Plotly Express again. The cache keeps the built ``Figure`` rather than
+its JSON: Streamlit re-validates dicts on every ``st.plotly_chart`` call but
+only serializes figures, so caching the object skips both the construction
+and the validation.
+
+Cached figures are shared between sessions and must not be modified after
+they are returned. ``keep_versions`` drops the figures of data versions that
+are no longer served, instead of leaving them to age out of the LRU.
+"""
+import threading
+from collections import OrderedDict
+
+
+class FigureCache:
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: tuple, build):
+        """Return the figure cached under ``key``, calling ``build()`` on a miss."""
+        with self._lock:
+            figure = self._figures.get(key)
+            if figure is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+                return figure
+            self.misses += 1
+
+        # Build outside the lock so slow figures don't block other sessions
+        figure = build()
+        with self._lock:
+            self._figures[key] = figure
+            self._figures.move_to_end(key)
+            while len(self._figures) > self.maxsize:
+                self._figures.popitem(last=False)
+        return figure
+
+    def keep_versions(self, *versions: str) -> None:
+        """Drop every figure built from a data version other than ``versions``."""
+        with self._lock:
+            for key in [key for key in self._figures if key[0] not in versions]:
+                del self._figures[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._figures),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,178 @@
+"""Dense bank × period arrays of the per-bank measures.
+
+The long frame has one row per bank and period, so every bank-wise view used
+to be a boolean filter on bank names or dates over all of it. ``BankMatrix``
+lays each measure out as a 2-D array with one row per bank (integer ids in
+name order) and one column per period (sorted period keys). A bank's history
+is then a row, one period across all banks is a column, a range of periods is
+a column slice, and growth or market share are whole-array operations.
+
+The measures are stacked into one (measure, bank, period) array, so
+``range_change`` computes every bank's change in every measure over a range
+in a single pass, whatever the number of banks and periods.
+
+Cells of a bank that didn't report in a period hold NaN, and ``present``
+tells them apart from reported values. The matrix is built once per data
+version and shared by every session, so its arrays are read-only.
+"""
+import numpy as np
+import pandas as pd
+
+from dldata.periods import key_slice
+from dldata.schema import MEASURE_COLUMNS, SUMMED_COLUMNS
+from dldata.timing import timed
+
+# Per-period labels kept alongside the period keys
+INFO_COLUMNS = ["FY", "Year", "Month", "Week", "type", "Date", "Ndate"]
+
+RANGE_CHANGE_COLUMNS = ["Bank", "Measure", "Start", "End", "Change", "Change %", "Share Start", "Share End", "Share Shift"]
+
+
+class BankMatrix:
+    def __init__(self, banks: np.ndarray, periods: np.ndarray, info: pd.DataFrame, measures: list, array: np.ndarray, present: np.ndarray):
+        self.banks = banks          # bank names; a bank's id is its position
+        self.periods = periods      # sorted period keys; a period's column is its position
+        self.info = info            # one row of labels per period, aligned with ``periods``
+        self.measures = measures    # measure names, in the order of ``array``'s first axis
+        self.array = array          # (measure, bank, period) array of every measure
+        self.present = present      # (bank, period) mask of reported cells
+        self.values = {m: array[i] for i, m in enumerate(measures)}  # measure -> (bank, period) view
+
+    @classmethod
+    @timed
+    def build(cls, frame: pd.DataFrame, measures: list = MEASURE_COLUMNS) -> "BankMatrix":
+        """Matrix of ``frame``'s bank rows, which need a ``Period`` key column."""
+        # Ids follow the bank names' sort order, whatever order the categories are in
+        codes, names = pd.factorize(frame["Bank"])
+        names = np.asarray(names.astype(str), dtype=object)
+        order = np.argsort(names)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        codes, banks = rank[codes], names[order]
+        periods, first, columns = np.unique(frame["Period"].to_numpy(), return_index=True, return_inverse=True)
+        info_columns = [c for c in INFO_COLUMNS + ["ChartDate"] if c in frame.columns]
+        info = frame[info_columns].iloc[first].reset_index(drop=True)
+
+        shape = (len(banks), len(periods))
+        present = np.zeros(shape, dtype=bool)
+        present[codes, columns] = True
+        present.flags.writeable = False
+        source = frame[list(measures)].to_numpy()
+        array = np.full((len(measures), *shape), np.nan, dtype=source.dtype)
+        array[:, codes, columns] = source.T
+        array.flags.writeable = False
+        return cls(banks, periods, info, list(measures), array, present)
+
+    def bank_ids(self, names) -> np.ndarray:
+        """Ids of the named banks, in the order given."""
+        names = np.asarray(names, dtype=object)
+        ids = np.searchsorted(self.banks, names)
+        known = (ids < len(self.banks)) & (self.banks[np.minimum(ids, len(self.banks) - 1)] == names)
+        if not known.all():
+            raise KeyError(f"unknown banks: {', '.join(names[~known])}")
+        return ids
+
+    def columns(self, start_key: int, end_key: int) -> slice:
+        """Columns of the periods from ``start_key`` to ``end_key``."""
+        return key_slice(self.periods, start_key, end_key)
+
+    def column(self, key: int):
+        """Column of period ``key``, or None if it isn't in the matrix."""
+        position = np.searchsorted(self.periods, key)
+        if position < len(self.periods) and self.periods[position] == key:
+            return int(position)
+        return None
+
+    def series(self, measure: str, bank: str) -> np.ndarray:
+        """``measure`` of one bank across every period."""
+        return self.values[measure][self.bank_ids([bank])[0]]
+
+    def growth(self, measure: str, pct: bool = False) -> np.ndarray:
+        """Period-on-period change (or % change) of every bank; the first column is NaN."""
+        array = self.values[measure].astype("float64")
+        change = np.full_like(array, np.nan)
+        change[:, 1:] = array[:, 1:] - array[:, :-1]
+        if pct:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                change[:, 1:] /= array[:, :-1] / 100
+        return change
+
+    def market_share(self, measure: str) -> np.ndarray:
+        """Every bank's share of the period total of ``measure``, in percent."""
+        array = self.values[measure].astype("float64")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return array / np.nansum(array, axis=0) * 100
+
+    @timed
+    def range_change(self, columns: slice) -> pd.DataFrame:
+        """Every bank's change in every measure over ``columns``, one row per bank and measure.
+
+        Start and End are a bank's first and last reported values in the
+        range, so banks that joined or stopped reporting midway still get a
+        row. Share Start and Share End are the bank's percentage of the
+        industry total in those periods, and Share Shift is their difference
+        in percentage points; shares are NaN for the CD ratio. Change % is
+        NaN where Start is 0.
+        """
+        present = self.present[:, columns]
+        if present.shape[1] == 0:
+            return pd.DataFrame(columns=RANGE_CHANGE_COLUMNS)
+        block = self.array[:, :, columns].astype("float64")
+        reported = present.any(axis=1)
+        first = present.argmax(axis=1)
+        last = present.shape[1] - 1 - present[:, ::-1].argmax(axis=1)
+
+        # (measure, bank) arrays, gathered for all measures at once
+        banks = np.arange(len(self.banks))
+        start = block[:, banks, first]
+        end = block[:, banks, last]
+        start[:, ~reported] = np.nan
+        end[:, ~reported] = np.nan
+        totals = np.nansum(block, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # No percentage change from zero, e.g. a bank's first FCY deposits
+            change_pct = np.where(start == 0, np.nan, (end - start) / start * 100)
+            share_start = start / totals[:, first] * 100
+            share_end = end / totals[:, last] * 100
+        not_summed = ~np.isin(self.measures, SUMMED_COLUMNS)
+        share_start[not_summed] = np.nan
+        share_end[not_summed] = np.nan
+
+        return pd.DataFrame({
+            "Bank": np.tile(self.banks, len(self.measures)),
+            "Measure": np.repeat(self.measures, len(self.banks)),
+            "Start": start.ravel(),
+            "End": end.ravel(),
+            "Change": (end - start).ravel(),
+            "Change %": change_pct.ravel(),
+            "Share Start": share_start.ravel(),
+            "Share End": share_end.ravel(),
+            "Share Shift": (share_end - share_start).ravel(),
+        })
+
+    def cross_section(self, key: int, measures: list = MEASURE_COLUMNS) -> pd.DataFrame:
+        """``Bank`` and ``measures`` of every bank that reported period ``key``."""
+        column = self.column(key)
+        if column is None:
+            return pd.DataFrame(columns=["Bank", *measures])
+        rows = np.flatnonzero(self.present[:, column])
+        return pd.DataFrame({"Bank": self.banks[rows], **{m: self.values[m][rows, column] for m in measures}})
+
+    def bank_frame(self, bank: str, measures: list = MEASURE_COLUMNS) -> pd.DataFrame:
+        """The period labels and ``measures`` of every period ``bank`` reported."""
+        bank_id = self.bank_ids([bank])[0]
+        columns = np.flatnonzero(self.present[bank_id])
+        frame = self.info.iloc[columns].reset_index(drop=True)
+        return frame.assign(Bank=bank, **{m: self.values[m][bank_id, columns] for m in measures})
+
+    def long_frame(self, measure: str, banks: list, columns: slice, label: str) -> pd.DataFrame:
+        """``Bank``, the ``label`` period column and ``measure`` for ``banks`` over ``columns``, for charts."""
+        ids = self.bank_ids(banks)
+        block = self.values[measure][ids, columns]
+        reported = self.present[ids, columns]
+        bank_rows, period_cols = np.nonzero(reported)
+        return pd.DataFrame({
+            "Bank": np.asarray(banks, dtype=object)[bank_rows],
+            label: self.info[label].to_numpy()[columns][period_cols],
+            measure: block[bank_rows, period_cols],
+        })
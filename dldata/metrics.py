@@ -0,0 +1,201 @@
+"""Operational metrics in the Prometheus text format.
+
+Set ``DLDATA_METRICS_PORT`` and the dashboard serves ``/metrics`` on that port
+from a small HTTP server thread inside the Streamlit process, for a local
+Prometheus (or any scraper of the text format) to read::
+
+    DLDATA_METRICS_PORT=9464 streamlit run main.py
+    curl localhost:9464/metrics
+
+Exposed metrics:
+
+    dldata_reruns_total{page}                  reruns, fragment reruns included
+    dldata_rerun_duration_seconds{page}        histogram of rerun latency
+    dldata_span_duration_seconds{span}         histogram of the spans of reruns
+    dldata_cache_hits_total{cache, name}       dataset and figure cache hits
+    dldata_cache_misses_total{cache, name}     ... and misses, i.e. builds
+    dldata_cache_entries{cache}                entries in the figure cache
+    dldata_active_sessions                     connected browser sessions
+    dldata_data_swaps_total                    data versions swapped in by dldata.watcher
+    process_resident_memory_bytes              resident set size
+
+Rerun counts and latencies, and the durations of their spans, come from
+``dldata.timing`` reruns, with the bucket bounds of ``timing.BUCKETS_MS``. Values that
+belong to the dashboard rather than this package, such as sessions or the
+figure cache, are read by collectors it registers with ``add_collector``.
+Each Streamlit process serves its own numbers, so run one port per process.
+"""
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dldata import timing
+
+logger = logging.getLogger(__name__)
+
+PORT_ENV = "DLDATA_METRICS_PORT"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets, in seconds, the same as the debug panel's
+LATENCY_BUCKETS = tuple(ms / 1000 for ms in timing.BUCKETS_MS)
+
+METRICS = {
+    "dldata_reruns_total": ("counter", "Script reruns, by page or fragment."),
+    "dldata_rerun_duration_seconds": ("histogram", "Rerun latency, by page or fragment."),
+    "dldata_span_duration_seconds": ("histogram", "Duration of the timing spans of reruns, by span."),
+    "dldata_cache_hits_total": ("counter", "Cache lookups served from the cache."),
+    "dldata_cache_misses_total": ("counter", "Cache lookups that had to build the value."),
+    "dldata_cache_entries": ("gauge", "Values held by a cache."),
+    "dldata_active_sessions": ("gauge", "Browser sessions connected to this process."),
+    "dldata_data_swaps_total": ("counter", "Data versions built and swapped in by the data watcher."),
+    "process_resident_memory_bytes": ("gauge", "Resident set size of this process."),
+}
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _value(value) -> str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in sorted(labels.items())) + "}"
+
+
+class Registry:
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._counters = {}
+        self._histograms = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    # Metric names are positional-only so any label name, "name" included, can be used
+    def inc(self, metric: str, amount: float = 1, /, **labels) -> None:
+        key = (metric, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, metric: str, value: float, /, **labels) -> None:
+        key = (metric, tuple(sorted(labels.items())))
+        with self._lock:
+            # Per-bucket counts, then the sum and the count
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram[i] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    def add_collector(self, collect) -> None:
+        """Call ``collect()`` on every scrape; it yields ``(name, labels, value)`` samples."""
+        with self._lock:
+            self._collectors.append(collect)
+
+    def render(self) -> str:
+        """Every metric in the Prometheus text exposition format."""
+        samples = {name: [] for name in METRICS}
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                samples[name].append(f"{name}{_labels(dict(labels))} {_value(value)}")
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                labels = dict(labels)
+                for bound, count in zip(self.buckets + ("+Inf",), histogram[:len(self.buckets)] + [histogram[-1]]):
+                    samples[name].append(f"{name}_bucket{_labels({**labels, 'le': bound})} {count}")
+                samples[name].append(f"{name}_sum{_labels(labels)} {_value(histogram[-2])}")
+                samples[name].append(f"{name}_count{_labels(labels)} {histogram[-1]}")
+            collectors = list(self._collectors)
+
+        for collect in collectors:
+            try:
+                for name, labels, value in collect():
+                    samples[name].append(f"{name}{_labels(labels)} {_value(value)}")
+            except Exception:
+                # A failing collector shouldn't take the other metrics down
+                logger.exception("metrics collector %r failed", collect)
+
+        lines = []
+        for name, (kind, help_text) in METRICS.items():
+            if samples[name]:
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", *samples[name]]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+inc = REGISTRY.inc
+observe = REGISTRY.observe
+add_collector = REGISTRY.add_collector
+render = REGISTRY.render
+
+
+def _record_rerun(record: dict) -> None:
+    inc("dldata_reruns_total", page=record["rerun"])
+    observe("dldata_rerun_duration_seconds", record["ms"] / 1000, page=record["rerun"])
+    for span in record["spans"]:
+        observe("dldata_span_duration_seconds", span["ms"] / 1000, span=span["name"])
+
+
+def _process_samples():
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        return
+    yield "process_resident_memory_bytes", {}, pages * os.sysconf("SC_PAGE_SIZE")
+
+
+timing.TIMINGS.listeners.append(_record_rerun)
+add_collector(_process_samples)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would flood the app's log
+        pass
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def serve(port: int, host: str = "127.0.0.1"):
+    """Serve ``/metrics`` on ``host:port`` from a daemon thread, once per process."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _Handler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="dldata-metrics", daemon=True).start()
+        return _server
+
+
+def serve_from_env():
+    """``serve`` on the port in ``DLDATA_METRICS_PORT``; None when it's unset or taken."""
+    port = os.environ.get(PORT_ENV)
+    if not port:
+        return None
+    try:
+        return serve(int(port))
+    except (OSError, ValueError) as e:
+        logger.warning("not serving metrics on %r: %s", port, e)
+        return None
@@ -0,0 +1,98 @@
+"""Vectorized Bikram Sambat (BS) <-> AD conversion.
+
+BS month lengths don't follow a rule, so conversion is driven by a lookup table
+of days per month. Dates are turned into day ordinals (days since 1 Baisakh of
+the first table year), which are also days since ``AD_EPOCH``, so converting is
+a cumulative-sum lookup plus a ``searchsorted`` in either direction. Fiscal
+years and months are integer arithmetic on the BS year and month.
+
+The table covers BS 2080-2082, the years Schema.csv spans. Month boundaries
+from Ashar 2080 to Jestha 2082 are fixed by the Ndate/Date pairs in the data
+(apart from two fiscal-year-end rows whose Ndate is a day off); the rest
+follow the published calendar, with each year's total matching the next
+Nepali new year. Add a row to ``MONTH_DAYS`` before loading data from
+later years; dates outside the table come back as missing values or NaT, or
+raise ``ValueError`` where there is no missing value to return.
+"""
+import numpy as np
+import pandas as pd
+
+BS_EPOCH_YEAR = 2080
+AD_EPOCH = np.datetime64("2023-04-14", "D")  # 1 Baisakh 2080
+
+# Days per month, Baisakh ... Chaitra, one row per BS year from BS_EPOCH_YEAR
+MONTH_DAYS = np.array([
+    [31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30],  # 2080
+    [31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],  # 2081
+    [31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],  # 2082
+], dtype=np.int32)
+
+# Ordinal of the first day of every (year, month), plus one past the end
+_MONTH_START = np.concatenate([[0], np.cumsum(MONTH_DAYS.ravel())]).astype(np.int32)
+_LAST_YEAR = BS_EPOCH_YEAR + len(MONTH_DAYS) - 1
+
+# The fiscal year starts on 1 Shrawan (BS month 4)
+FISCAL_START_MONTH = 4
+
+
+def bs_to_ordinal(year, month, day) -> np.ndarray:
+    """Day ordinals for BS dates; -1 where the date is invalid or out of range."""
+    year = np.asarray(year, dtype=np.int32)
+    month = np.asarray(month, dtype=np.int32)
+    day = np.asarray(day, dtype=np.int32)
+
+    valid = (year >= BS_EPOCH_YEAR) & (year <= _LAST_YEAR) & (month >= 1) & (month <= 12)
+    index = np.where(valid, (year - BS_EPOCH_YEAR) * 12 + month - 1, 0)
+    valid &= (day >= 1) & (day <= MONTH_DAYS.ravel()[index])
+    return np.where(valid, _MONTH_START[index] + day - 1, -1)
+
+
+def ordinal_to_bs(ordinal) -> tuple:
+    """(year, month, day) arrays for day ordinals; ordinals must be in range."""
+    ordinal = np.asarray(ordinal, dtype=np.int32)
+    if ordinal.size and (ordinal.min() < 0 or ordinal.max() >= _MONTH_START[-1]):
+        raise ValueError(f"date outside the BS {BS_EPOCH_YEAR}-{_LAST_YEAR} calendar table")
+    index = np.searchsorted(_MONTH_START, ordinal, side="right") - 1
+    return BS_EPOCH_YEAR + index // 12, index % 12 + 1, ordinal - _MONTH_START[index] + 1
+
+
+def bs_to_ad(year, month, day) -> np.ndarray:
+    """AD dates (datetime64[D]) for BS dates; NaT where the BS date is invalid."""
+    ordinal = bs_to_ordinal(year, month, day)
+    return np.where(ordinal >= 0, AD_EPOCH + ordinal, np.datetime64("NaT", "D"))
+
+
+def ad_to_bs(dates) -> tuple:
+    """(year, month, day) arrays for AD dates."""
+    days = np.asarray(dates, dtype="datetime64[D]")
+    return ordinal_to_bs((days - AD_EPOCH).astype(np.int32))
+
+
+def fiscal_year(year, month) -> np.ndarray:
+    """Starting BS year of the fiscal year a BS (year, month) falls in."""
+    return np.asarray(year) - (np.asarray(month) < FISCAL_START_MONTH)
+
+
+def fiscal_month(month) -> np.ndarray:
+    """Position of a BS month in its fiscal year, Shrawan = 1 ... Ashar = 12."""
+    return (np.asarray(month) - FISCAL_START_MONTH) % 12 + 1
+
+
+def parse_ndate(ndate: pd.Series) -> pd.DataFrame:
+    """Split ``M/D/YYYY`` Ndate strings into BS year/month/day and a day ordinal.
+
+    Columns are nullable integers, missing where Ndate is blank, malformed or
+    outside the calendar table.
+    """
+    parts = ndate.astype("string").str.extract(r"^\s*(\d{1,2})/(\d{1,2})/(\d{4})\s*$")
+    parts = parts.apply(pd.to_numeric).to_numpy(dtype=np.float64)
+    parsed = ~np.isnan(parts).any(axis=1)
+    month, day, year = np.nan_to_num(parts, nan=0).astype(np.int32).T
+
+    ordinal = bs_to_ordinal(year, month, day)
+    missing = ~parsed | (ordinal < 0)
+    columns = {"BS Year": year, "BS Month": month, "BS Day": day, "BS Ordinal": ordinal}
+    return pd.DataFrame(
+        {name: pd.arrays.IntegerArray(values.astype(np.int32), missing) for name, values in columns.items()},
+        index=ndate.index,
+    )
@@ -0,0 +1,90 @@
+"""Ordered integer keys for reporting periods.
+
+A period key packs the fiscal year, the Nepali month's position in the fiscal
+year (Shrawan = 1 ... Ashar = 12) and the week's position in the month
+(1st-5th week, month end last) into one integer::
+
+    key = fiscal_start_year * 1000 + month_ordinal * 10 + week_ordinal
+
+so sorting by key sorts chronologically, and every From/To selection becomes
+a binary search over a sorted key column followed by a positional slice.
+"""
+import numpy as np
+import pandas as pd
+
+from dldata.nepali_calendar import fiscal_month, fiscal_year
+
+# Nepali months in fiscal-year order (the fiscal year starts in Shrawan)
+NEPALI_MONTHS = [
+    "Shrawan", "Bhadra", "Ashoj", "Kartik", "Mangsir", "Poush",
+    "Magh", "Falgun", "Chaitra", "Baisakh", "Jestha", "Ashar",
+]
+MONTH_ORDINAL = {month: i for i, month in enumerate(NEPALI_MONTHS, 1)}
+# BS month number of each month label (Baisakh = 1), for the calendar's fiscal arithmetic
+BS_MONTH = {month: i for i, month in enumerate(NEPALI_MONTHS[9:] + NEPALI_MONTHS[:9], 1)}
+
+WEEK_ORDINAL = {
+    "1st Week": 1,
+    "2nd Week": 2,
+    "3rd Week": 3,
+    "4th Week": 4,
+    "5th Week": 5,
+    "End Date": 9,
+}
+MONTH_START = 0
+MONTH_END = 9
+
+# Key of rows whose Month or Week label is unknown or missing; below every real key
+UNKNOWN_PERIOD = -1
+
+
+def _ordinals(series: pd.Series, mapping: dict) -> np.ndarray:
+    """``mapping`` of each label, -1 where the label is unknown or missing."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Map the categories once and gather by code; code -1 (missing) picks the trailing -1
+        table = np.array([mapping.get(c, -1) for c in series.cat.categories] + [-1], dtype=np.int32)
+        return table[series.cat.codes.to_numpy()]
+    return series.map(mapping).fillna(-1).to_numpy(dtype=np.int32)
+
+
+def period_key(year: int, month: str, week=MONTH_START) -> int:
+    """Key for a single period; ``week`` is a week label or an ordinal."""
+    bs_month = BS_MONTH[month]
+    week_ordinal = WEEK_ORDINAL[week] if isinstance(week, str) else week
+    return int(fiscal_year(int(year), bs_month)) * 1000 + int(fiscal_month(bs_month)) * 10 + week_ordinal
+
+
+def period_keys(frame: pd.DataFrame) -> np.ndarray:
+    """Vectorized period_key over a frame's Year, Month and Week columns.
+
+    Rows with an unknown or missing Month or Week get ``UNKNOWN_PERIOD``.
+    """
+    bs_month = _ordinals(frame["Month"], BS_MONTH)
+    week = _ordinals(frame["Week"], WEEK_ORDINAL)
+    year = frame["Year"].to_numpy(dtype=np.int32)
+    keys = fiscal_year(year, bs_month) * 1000 + fiscal_month(bs_month) * 10 + week
+    return np.where((bs_month < 0) | (week < 0), UNKNOWN_PERIOD, keys).astype(np.int32)
+
+
+def month_span(year: int, month: str) -> tuple:
+    """First and last possible key of a month, for month-level selectors."""
+    return period_key(year, month, MONTH_START), period_key(year, month, MONTH_END)
+
+
+def key_slice(keys: np.ndarray, start_key: int, end_key: int) -> slice:
+    """Positions of ``start_key <= key <= end_key`` in a sorted key array."""
+    lo = np.searchsorted(keys, start_key, side="left")
+    hi = np.searchsorted(keys, end_key, side="right")
+    return slice(lo, max(lo, hi))
+
+
+def month_options(frame: pd.DataFrame) -> list:
+    """Months present in ``frame``, in fiscal-year order."""
+    present = set(frame["Month"].astype(str))
+    return [month for month in NEPALI_MONTHS if month in present]
+
+
+def week_options(frame: pd.DataFrame) -> list:
+    """Week labels present in ``frame``, month end last."""
+    present = set(frame["Week"].astype(str))
+    return [week for week in WEEK_ORDINAL if week in present]
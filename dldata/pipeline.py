@@ -0,0 +1,35 @@
+"""Load → aggregate entry points used by the dashboard."""
+import pandas as pd
+
+from dldata import snapshot, store, validate
+from dldata.cube import Cube, build_cube, cd_percent
+from dldata.schema import DATA_FILE
+from dldata.source import data_version
+
+
+def data_source() -> str:
+    """The partitioned store once it has been created, Schema.csv before that."""
+    return store.STORE_DIR if store.is_store(store.STORE_DIR) else DATA_FILE
+
+
+def source_version(path: str = DATA_FILE) -> str:
+    """Version of a store or CSV source; caches key on it."""
+    return store.store_version(path) if store.is_store(path) else data_version(path)
+
+
+def load_data(path: str = DATA_FILE, version: str = None) -> pd.DataFrame:
+    """Per-bank rows with the CD ratio expressed as a percentage.
+
+    The rows are validated once per data version; issues are logged and can
+    be listed with ``python -m dldata.validate``.
+    """
+    version = version or source_version(path)
+    # Both raise StaleVersionError if the source no longer holds ``version``
+    df = store.read_rows(path, version) if store.is_store(path) else snapshot.load(path, version)
+    validate.report(df, version)
+    return cd_percent(df)
+
+
+def build(path: str = DATA_FILE, version: str = None) -> Cube:
+    version = version or source_version(path)
+    return build_cube(load_data(path, version))
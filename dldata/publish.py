@@ -0,0 +1,105 @@
+"""Prepared datasets shared by every worker process through memory-mapped files.
+
+With several Streamlit processes behind a load balancer, each one used to
+parse the source and build its own copies of the rollups. ``publish`` builds
+them once and writes every ``Cube`` frame as an uncompressed Arrow IPC file
+in a directory named after the data version::
+
+    datasets/
+        8a4df47896a1c964.2/      data version and DATASETS_FORMAT
+            banks.arrow
+            periods.arrow
+            ...
+
+Workers open the files memory-mapped, and ``read_snapshot`` keeps their
+columns as views of the mapped pages instead of copying them into pandas
+blocks. The data therefore lives once in the OS page cache however many
+workers there are, and a new worker starts without parsing anything.
+
+A version is written under a temporary name and renamed into place, which is
+atomic, so a worker either finds a complete version or none at all and then
+builds the datasets itself. Publish after every data update, e.g. right after
+``python -m dldata.store ingest``::
+
+    python -m dldata.publish [source]
+
+The newest ``KEEP_VERSIONS`` versions are kept. Files removed while a worker
+still has them mapped stay readable until it lets go of them.
+"""
+import os
+import shutil
+import sys
+
+from dldata.pipeline import build, data_source, source_version
+from dldata.snapshot import read_snapshot, write_snapshot
+
+DATASETS_DIR = "datasets"
+KEEP_VERSIONS = 2
+
+# Bump when the published frames change for the same data version, so
+# workers ignore datasets published by older code.
+# 2: period totals are recomputed from their LCY + FCY parts
+DATASETS_FORMAT = "2"
+
+# Cube frames that are published; the rest are derived from them per process
+PUBLISHED = ("banks", "periods", "months", "weeks", "bank_months", "fiscal_years")
+
+
+def _version_dir(version: str, path: str) -> str:
+    return os.path.join(path, f"{version}.{DATASETS_FORMAT}")
+
+
+def _dataset_path(name: str, version: str, path: str) -> str:
+    return os.path.join(_version_dir(version, path), f"{name}.arrow")
+
+
+def read_dataset(name: str, version: str, path: str = DATASETS_DIR):
+    """The published ``name`` frame of data ``version``, or None if it isn't published."""
+    if name not in PUBLISHED:
+        return None
+    return read_snapshot(version, _dataset_path(name, version, path))
+
+
+def _prune(path: str, keep: int) -> None:
+    versions = [entry for entry in os.scandir(path) if entry.is_dir() and not entry.name.startswith(".")]
+    versions.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+    for entry in versions[keep:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def publish(source: str = None, path: str = DATASETS_DIR, keep: int = KEEP_VERSIONS) -> str:
+    """Build and publish the datasets of ``source``'s current version; return the version."""
+    source = source or data_source()
+    version = source_version(source)
+    target = _version_dir(version, path)
+    if os.path.isdir(target):
+        return version
+
+    os.makedirs(path, exist_ok=True)
+    tmp_dir = os.path.join(path, f".{version}.{os.getpid()}.tmp")
+    os.makedirs(tmp_dir, exist_ok=True)
+    try:
+        cube = build(source, version)
+        for name in PUBLISHED:
+            write_snapshot(getattr(cube, name), version, os.path.join(tmp_dir, f"{name}.arrow"))
+        try:
+            os.rename(tmp_dir, target)
+        except OSError:
+            # Another process published the same version first
+            if not os.path.isdir(target):
+                raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    _prune(path, keep)
+    return version
+
+
+def main(argv) -> int:
+    source = argv[1] if len(argv) > 1 else data_source()
+    version = publish(source)
+    print(f"Published {source} as {_version_dir(version, DATASETS_DIR)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
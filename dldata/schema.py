@@ -0,0 +1,31 @@
+"""Column names and dtypes of Schema.csv."""
+
+DATA_FILE = "Schema.csv"
+
+# Amount columns that are summed across banks
+SUMMED_COLUMNS = ['DLCY', 'DFCY', 'DTOTAL', 'LLCY', 'LFCY', 'LTOTAL']
+
+# Every numeric measure, including the CD ratio (averaged, not summed)
+MEASURE_COLUMNS = SUMMED_COLUMNS + ['CD']
+
+# Totals and the LCY + FCY parts they add up
+TOTAL_PARTS = (('DTOTAL', ['DLCY', 'DFCY']), ('LTOTAL', ['LLCY', 'LFCY']))
+
+# Compact dtypes for Schema.csv: low-cardinality labels become categoricals and
+# the amounts (billions, two decimals) fit comfortably in float32.
+SCHEMA_DTYPES = {
+    "FY": "category",
+    "Year": "int16",
+    "Month": "category",
+    "Week": "category",
+    "type": "category",
+    "Ndate": "string",
+    "Bank": "category",
+    "DLCY": "float32",
+    "DFCY": "float32",
+    "DTOTAL": "float32",
+    "LLCY": "float32",
+    "LFCY": "float32",
+    "LTOTAL": "float32",
+    "CD": "float32",
+}
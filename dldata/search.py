@@ -0,0 +1,157 @@
+"""Inverted index over the period table for the Search page.
+
+Every period row is tokenized once per data version from its description,
+year, month (plus common spellings of the Nepali and English month names),
+fiscal year, English and Nepali dates and long date. Dates are indexed whole
+and by their parts, so ``2024-07``, ``3/7/2081`` and ``2081`` all resolve.
+
+A query is split into terms; each term matches every indexed token it occurs
+in, so ``81/82``, ``/2081`` and ``st Week`` match inside ``2081/82``,
+``3/7/2081`` and ``1st Week``. Every suffix of every token is kept in a
+sorted list, and a term's matches are the suffixes it is a prefix of.
+Postings are kept per row and field, so intersecting them requires all terms
+to occur in the same field of a row. Any row the old per-column
+``str.contains`` scan matched still matches; as each term is matched on its
+own, rows whose field has the terms in another order or inside other words
+(``st`` in ``Jestha``) match too. Matching is case-insensitive.
+
+Typeahead suggestions complete the last term to the tokens it is a prefix of.
+"""
+import bisect
+import re
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from dldata.timing import timed
+
+# Alternative spellings for the Nepali months as they appear in Schema.csv
+MONTH_ALIASES = {
+    "Baisakh": ["baishakh", "vaisakh", "vaishakh"],
+    "Jestha": ["jeth", "jeshtha", "jyeshtha", "jyestha"],
+    "Ashar": ["asar", "asadh", "ashadh", "aashar"],
+    "Shrawan": ["saun", "sawan", "shravan", "srawan"],
+    "Bhadra": ["bhadau", "bhadrapad"],
+    "Ashoj": ["asoj", "ashwin", "aswin"],
+    "Kartik": ["kartika", "kattik"],
+    "Mangsir": ["mangshir", "marga", "margashirsha"],
+    "Poush": ["push", "paush", "pausa"],
+    "Magh": ["magha"],
+    "Falgun": ["phagun", "phalgun", "fagun"],
+    "Chaitra": ["chait", "chaita"],
+}
+
+_ALIASES = {alias for aliases in MONTH_ALIASES.values() for alias in aliases}
+_SPLIT = re.compile(r"[\s,]+")
+_DATE_PARTS = re.compile(r"[-/]")
+_END = "\uffff"
+
+
+def _tokens(value: str) -> set:
+    tokens = set()
+    for word in _SPLIT.split(value.lower()):
+        if not word:
+            continue
+        tokens.add(word)
+        if _DATE_PARTS.search(word):
+            tokens.update(part for part in _DATE_PARTS.split(word) if part)
+    return tokens
+
+
+def _terms(query: str) -> list:
+    return [term for term in _SPLIT.split(query.lower()) if term]
+
+
+class SearchIndex:
+    def __init__(self, vocabulary: list, postings: list, display: dict, fields: int):
+        self.vocabulary = vocabulary  # sorted, lower-cased tokens
+        self.postings = postings      # row * fields + field per token, sorted int32 arrays
+        self.display = display        # token -> spelling shown in suggestions
+        self.fields = fields
+        # Every suffix of every token, sorted, with the position of its token in vocabulary
+        suffixes = sorted((token[start:], i) for i, token in enumerate(vocabulary) for start in range(len(token)))
+        self.suffixes = [suffix for suffix, _ in suffixes]
+        self.suffix_tokens = np.array([i for _, i in suffixes], dtype=np.int32)
+
+    @classmethod
+    def build(cls, periods: pd.DataFrame) -> "SearchIndex":
+        fields = [
+            periods['Description'].astype(str),
+            periods['Year'].astype(str),
+            periods['Month'].astype(str),
+            periods['FY'].astype(str),
+            periods['Date'].dt.strftime('%Y-%m-%d'),
+            periods['Ndate'].astype(str),
+            periods['Long Date'].astype(str),
+        ]
+        index = defaultdict(set)
+        display = {}
+        width = len(fields)
+        for row, values in enumerate(zip(*fields)):
+            for field, value in enumerate(values):
+                for word in _SPLIT.split(value):
+                    display.setdefault(word.lower(), word)
+                for token in _tokens(value):
+                    index[token].add(row * width + field)
+            # Month aliases apply to the Month field and to the description
+            for alias in MONTH_ALIASES.get(values[2], ()):
+                index[alias].update((row * width, row * width + 2))
+                display.setdefault(alias, alias.capitalize())
+
+        vocabulary = sorted(index)
+        postings = [np.fromiter(sorted(index[token]), dtype=np.int32) for token in vocabulary]
+        return cls(vocabulary, postings, display, width)
+
+    @staticmethod
+    def _prefix_range(words: list, term: str) -> range:
+        """Positions of the entries of sorted ``words`` that start with ``term``."""
+        lo = bisect.bisect_left(words, term)
+        hi = bisect.bisect_left(words, term + _END, lo)
+        return range(lo, hi)
+
+    def lookup(self, term: str) -> np.ndarray:
+        """Row/field postings with a token that contains ``term``."""
+        matches = self._prefix_range(self.suffixes, term.lower())
+        tokens = np.unique(self.suffix_tokens[matches.start:matches.stop])
+        if not len(tokens):
+            return np.empty(0, dtype=np.int32)
+        if len(tokens) == 1:
+            return self.postings[tokens[0]]
+        return np.unique(np.concatenate([self.postings[i] for i in tokens]))
+
+    def _match(self, terms: list) -> np.ndarray:
+        hits = None
+        for term in terms:
+            postings = self.lookup(term)
+            hits = postings if hits is None else np.intersect1d(hits, postings, assume_unique=True)
+            if not len(hits):
+                break
+        return np.empty(0, dtype=np.int32) if hits is None else hits
+
+    @timed
+    def search(self, query: str) -> np.ndarray:
+        """Row positions matching every term of ``query``, in table order."""
+        return np.unique(self._match(_terms(query)) // self.fields)
+
+    def suggest(self, query: str, limit: int = 8) -> list:
+        """Completions of the last term that still match the earlier terms."""
+        terms = _terms(query)
+        if not terms or query[-1:].isspace():
+            return []
+        head = self._match(terms[:-1]) if len(terms) > 1 else None
+
+        candidates = []
+        for i in self._prefix_range(self.vocabulary, terms[-1]):
+            token = self.vocabulary[i]
+            if token == terms[-1]:
+                continue
+            hits = self.postings[i] if head is None else np.intersect1d(head, self.postings[i], assume_unique=True)
+            if len(hits):
+                # Most matching rows first, canonical spellings before aliases
+                candidates.append((-len(np.unique(hits // self.fields)), token in _ALIASES, token))
+
+        candidates.sort()
+        # Keep the user's own spelling of the earlier terms
+        prefix = query[:len(query) - len(query.split()[-1])]
+        return [prefix + self.display.get(token, token) for *_, token in candidates[:limit]]
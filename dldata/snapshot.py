@@ -0,0 +1,100 @@
+"""Columnar snapshot of Schema.csv.
+
+The snapshot is an Arrow IPC (Feather v2) file that stores the parsed, typed
+frame together with the version of the CSV it was built from. Loading it skips
+CSV tokenizing and dtype inference, so cold starts don't grow with the number
+of weekly rows. Build it ahead of a deploy with:
+
+    python -m dldata.snapshot [Schema.csv] [Schema.feather]
+
+The dashboard falls back to the CSV whenever the snapshot is missing, was
+built from a different CSV, or uses an older snapshot format.
+"""
+import os
+import sys
+
+import pandas as pd
+
+from dldata.schema import DATA_FILE
+from dldata.source import StaleVersionError, data_version, read_versioned_csv
+from dldata.timing import timed
+
+SNAPSHOT_FILE = "Schema.feather"
+
+# Bump when the parsed layout changes so older snapshots are rebuilt
+SNAPSHOT_FORMAT = "1"
+
+
+def write_snapshot(df: pd.DataFrame, version: str, path: str = SNAPSHOT_FILE) -> None:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b"dldata.format"] = SNAPSHOT_FORMAT.encode()
+    metadata[b"dldata.source_version"] = version.encode()
+    table = table.replace_schema_metadata(metadata)
+
+    # Write next to the target and rename so readers never see a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    # One record batch per file: readers can only map single-chunk columns
+    # without copying them
+    feather.write_feather(table, tmp_path, compression="uncompressed", chunksize=max(table.num_rows, 1))
+    os.replace(tmp_path, path)
+
+
+@timed
+def read_snapshot(version: str, path: str = SNAPSHOT_FILE):
+    """Return the snapshot frame, or None if it is missing or stale."""
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return None
+    if not os.path.exists(path):
+        return None
+
+    table = feather.read_table(path, memory_map=True)
+    metadata = table.schema.metadata or {}
+    if metadata.get(b"dldata.format") != SNAPSHOT_FORMAT.encode():
+        return None
+    if metadata.get(b"dldata.source_version") != version.encode():
+        return None
+    # Without consolidating into 2-D blocks, null-free numeric columns stay
+    # read-only views of the mapped file instead of being copied
+    return table.to_pandas(split_blocks=True)
+
+
+def load(path: str = DATA_FILE, version: str = None, snapshot_path: str = SNAPSHOT_FILE) -> pd.DataFrame:
+    """Load the schema frame from the snapshot, rebuilding it from the CSV when stale.
+
+    Raises ``StaleVersionError`` when ``version`` is given but the CSV has
+    since changed, rather than returning newer rows as that version.
+    """
+    version = version or data_version(path)
+    df = read_snapshot(version, snapshot_path)
+    if df is not None:
+        return df
+
+    df, read_version = read_versioned_csv(path)
+    try:
+        # Tagged with the version that was parsed, whichever was asked for
+        write_snapshot(df, read_version, snapshot_path)
+    except (ImportError, OSError):
+        # Read-only checkouts still work, they just keep parsing the CSV
+        pass
+    if read_version != version:
+        raise StaleVersionError(f"{path} changed from version {version} to {read_version}")
+    return df
+
+
+def main(argv) -> int:
+    csv_path = argv[1] if len(argv) > 1 else DATA_FILE
+    snapshot_path = argv[2] if len(argv) > 2 else SNAPSHOT_FILE
+    df, version = read_versioned_csv(csv_path)
+    write_snapshot(df, version, snapshot_path)
+    print(f"Wrote {snapshot_path}: {len(df)} rows, source version {version}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
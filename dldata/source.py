@@ -0,0 +1,49 @@
+"""Reading Schema.csv and identifying its content version."""
+import hashlib
+import io
+import os
+
+import pandas as pd
+
+from dldata.schema import DATA_FILE, SCHEMA_DTYPES
+from dldata.timing import timed
+
+_hash_memo = {}
+
+
+class StaleVersionError(ValueError):
+    """The source no longer holds the version that was asked for."""
+
+
+def _hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def data_version(path: str = DATA_FILE) -> str:
+    # Only re-hash the file when its mtime or size changes; a touched but
+    # unchanged file keeps the same version and therefore the same cache entry.
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if key not in _hash_memo:
+        with open(path, "rb") as f:
+            _hash_memo[key] = _hash(f.read())
+    return _hash_memo[key]
+
+
+@timed
+def read_csv(path=DATA_FILE) -> pd.DataFrame:
+    df = pd.read_csv(path, dtype=SCHEMA_DTYPES, encoding="utf-8-sig")
+    df["Date"] = pd.to_datetime(df["Date"], format="%m/%d/%Y")
+    return df
+
+
+def read_versioned_csv(path: str = DATA_FILE) -> tuple:
+    """``read_csv(path)`` and the version of exactly the bytes it parsed.
+
+    The file can be replaced between ``data_version`` and ``read_csv``; hashing
+    and parsing one read keeps a frame from being cached under another
+    version's key.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return read_csv(io.BytesIO(data)), _hash(data)
@@ -0,0 +1,241 @@
+"""Append-only store of per-bank rows, partitioned by fiscal year and period.
+
+Schema.csv has to be rewritten and fully reprocessed for every new week. The
+store instead keeps one Arrow IPC file per reporting period, next to the
+period totals of its fiscal year::
+
+    store/
+        manifest.json            partitions, aggregate files and data version
+        2081/
+            2081109.feather      bank rows of one period, named by period key
+            periods-<version>.feather
+                                 build_periods() rows of the fiscal year
+
+Ingesting a period writes its partition, recomputes the totals of that one
+fiscal year and then replaces the manifest, so the cost depends on the size
+of the new period and its fiscal year, not on the whole history. Readers
+only follow the manifest, which is replaced atomically, so they never see a
+half-ingested period. Every ingest chains a new data version onto the old
+one, and the dashboard's caches key on it.
+
+Create the store from Schema.csv, then ingest new releases in the Schema.csv
+layout::
+
+    python -m dldata.store init [Schema.csv]
+    python -m dldata.store ingest new_week.csv
+
+Rows that fail validation (see ``dldata.validate``) are refused; pass
+``--allow-invalid`` to take them anyway, e.g. for known issues in the history.
+
+The dashboard reads from the store once it exists and from Schema.csv
+otherwise.
+"""
+import hashlib
+import json
+import os
+import sys
+
+import pandas as pd
+
+from dldata import cube, validate
+from dldata.periods import UNKNOWN_PERIOD, period_keys
+from dldata.schema import DATA_FILE
+from dldata.snapshot import write_snapshot
+from dldata.source import StaleVersionError, data_version, read_csv
+from dldata.timing import timed
+
+STORE_DIR = "store"
+MANIFEST_FILE = "manifest.json"
+
+# Bump when the partition layout changes so older stores are rejected.
+# 2: period totals are recomputed from their LCY + FCY parts
+STORE_FORMAT = "2"
+
+_manifest_memo = {}
+
+
+def is_store(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, MANIFEST_FILE))
+
+
+def read_manifest(path: str = STORE_DIR) -> dict:
+    # The manifest is read on every rerun; only parse it again when it changes
+    manifest_path = os.path.join(path, MANIFEST_FILE)
+    stat = os.stat(manifest_path)
+    key = (manifest_path, stat.st_mtime_ns, stat.st_size)
+    if key not in _manifest_memo:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != STORE_FORMAT:
+            raise ValueError(f"{manifest_path} uses store format {manifest.get('format')!r}, expected {STORE_FORMAT!r}")
+        _manifest_memo.clear()
+        _manifest_memo[key] = manifest
+    return _manifest_memo[key]
+
+
+def store_version(path: str = STORE_DIR) -> str:
+    return read_manifest(path)["version"]
+
+
+def _write_manifest(path: str, manifest: dict) -> None:
+    manifest_path = os.path.join(path, MANIFEST_FILE)
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def _concat(tables: list) -> pd.DataFrame:
+    import pyarrow as pa
+
+    # Each part carries its own category dictionaries; merge them so labels
+    # come back as one categorical instead of falling back to object. Parts
+    # written from different sources can also differ in Date resolution.
+    return pa.concat_tables(tables, promote_options="permissive").unify_dictionaries().to_pandas()
+
+
+def _read_tables(paths: list) -> pd.DataFrame:
+    import pyarrow.feather as feather
+
+    return _concat([feather.read_table(p, memory_map=True) for p in paths])
+
+
+@timed
+def _versioned_manifest(path: str, version: str) -> dict:
+    manifest = read_manifest(path)
+    if version is not None and manifest["version"] != version:
+        raise StaleVersionError(f"{path} changed from version {version} to {manifest['version']}")
+    return manifest
+
+
+def _read_version(path: str, version: str, files) -> pd.DataFrame:
+    """The frame of the ``files(manifest)`` of ``version`` (the current one if None)."""
+    manifest = _versioned_manifest(path, version)
+    try:
+        return _read_tables(files(manifest))
+    except FileNotFoundError:
+        # An ingest removed the previous aggregates since the manifest was read
+        _versioned_manifest(path, manifest["version"])
+        raise
+
+
+@timed
+def read_rows(path: str = STORE_DIR, version: str = None) -> pd.DataFrame:
+    """Per-bank rows of every period in the store, in period order.
+
+    Raises ``StaleVersionError`` if ``version`` is given and no longer current.
+    """
+    return _read_version(path, version, lambda manifest: [
+        os.path.join(path, fiscal_year, f"{key}.feather")
+        for fiscal_year, entry in sorted(manifest["fiscal_years"].items())
+        for key in entry["periods"]
+    ])
+
+
+@timed
+def read_periods(path: str = STORE_DIR, version: str = None) -> pd.DataFrame:
+    """The stored ``cube.build_periods`` rows of every fiscal year, in period order.
+
+    Raises ``StaleVersionError`` if ``version`` is given and no longer current.
+    """
+    return _read_version(path, version, lambda manifest: [
+        os.path.join(path, fiscal_year, entry["aggregates"])
+        for fiscal_year, entry in sorted(manifest["fiscal_years"].items())
+    ])
+
+
+def _next_version(version: str, rows: pd.DataFrame) -> str:
+    digest = hashlib.sha256(version.encode())
+    digest.update(pd.util.hash_pandas_object(rows, index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _append(path: str, manifest: dict, rows: pd.DataFrame, version: str, allow_invalid: bool) -> dict:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    errors = validate.errors(validate.report(rows, version))
+    if len(errors) and not allow_invalid:
+        raise ValueError(f"{len(errors)} rows failed validation:\n{errors.to_string(index=False)}")
+
+    keys = period_keys(rows)
+    # Only reachable with allow_invalid: rows without a period have no partition
+    known = keys != UNKNOWN_PERIOD
+    rows, keys = rows[known], keys[known]
+    fiscal_years = manifest["fiscal_years"]
+    existing = {key for entry in fiscal_years.values() for key in entry["periods"]}
+    duplicated = sorted(set(keys.tolist()) & existing)
+    if duplicated:
+        raise ValueError(f"periods already in the store: {', '.join(map(str, duplicated))}")
+
+    stale = []
+    for fiscal_year, fy_rows in rows.groupby(keys // 1000, sort=True):
+        fy_dir = os.path.join(path, str(fiscal_year))
+        os.makedirs(fy_dir, exist_ok=True)
+        fy_keys = period_keys(fy_rows)
+        for key, period_rows in fy_rows.groupby(fy_keys, sort=True):
+            write_snapshot(period_rows.reset_index(drop=True), version, os.path.join(fy_dir, f"{key}.feather"))
+
+        # Only this fiscal year's totals are recomputed
+        entry = fiscal_years.get(str(fiscal_year), {"periods": [], "aggregates": None})
+        fy_periods = [int(k) for k in sorted(set(entry["periods"]) | set(fy_keys.tolist()))]
+        new_totals = cube.build_periods(cube.cd_percent(fy_rows))
+        if entry["aggregates"]:
+            old_path = os.path.join(fy_dir, entry["aggregates"])
+            new_totals = _concat([
+                feather.read_table(old_path),
+                pa.Table.from_pandas(new_totals, preserve_index=False),
+            ]).sort_values(by="Period", ignore_index=True)
+            stale.append(old_path)
+        aggregates = f"periods-{version}.feather"
+        write_snapshot(new_totals, version, os.path.join(fy_dir, aggregates))
+        fiscal_years[str(fiscal_year)] = {"periods": fy_periods, "aggregates": aggregates}
+
+    manifest = {"format": STORE_FORMAT, "version": version, "fiscal_years": fiscal_years}
+    _write_manifest(path, manifest)
+    for stale_path in stale:
+        os.remove(stale_path)
+    return manifest
+
+
+def init_store(csv_path: str = DATA_FILE, path: str = STORE_DIR, allow_invalid: bool = False) -> dict:
+    """Create the store from a Schema.csv file, keeping its content version."""
+    if is_store(path):
+        raise ValueError(f"{path} already holds a store")
+    os.makedirs(path, exist_ok=True)
+    empty = {"format": STORE_FORMAT, "version": None, "fiscal_years": {}}
+    return _append(path, empty, read_csv(csv_path), data_version(csv_path), allow_invalid)
+
+
+def ingest(rows: pd.DataFrame, path: str = STORE_DIR, allow_invalid: bool = False) -> dict:
+    """Append the bank rows of one or more new periods and bump the data version.
+
+    Rows that fail a ``validate.ERROR_CHECKS`` check are refused unless
+    ``allow_invalid`` is set.
+    """
+    manifest = read_manifest(path)
+    version = _next_version(manifest["version"], rows)
+    return _append(path, json.loads(json.dumps(manifest)), rows, version, allow_invalid)
+
+
+def main(argv) -> int:
+    allow_invalid = "--allow-invalid" in argv
+    argv = [arg for arg in argv if arg != "--allow-invalid"]
+    if len(argv) < 2 or argv[1] not in ("init", "ingest") or (argv[1] == "ingest" and len(argv) < 3):
+        print("usage: python -m dldata.store [--allow-invalid] init [Schema.csv] | ingest <rows.csv>", file=sys.stderr)
+        return 2
+    try:
+        if argv[1] == "init":
+            manifest = init_store(argv[2] if len(argv) > 2 else DATA_FILE, allow_invalid=allow_invalid)
+        else:
+            manifest = ingest(read_csv(argv[2]), allow_invalid=allow_invalid)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    periods = sum(len(entry["periods"]) for entry in manifest["fiscal_years"].values())
+    print(f"{STORE_DIR}: {periods} periods, data version {manifest['version']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,81 @@
+"""Synthetic Schema.csv-compatible data for benchmarks.
+
+``synthetic_schema(scale)`` builds roughly ``scale`` times as many rows as the
+real data by adding banks and extending the weekly history backwards, one
+fiscal year at a time. Amounts follow a per-bank random walk so totals, growth
+and CD ratios look plausible; the frame has the same columns and dtypes as
+``read_csv`` returns and passes the error-level validation checks.
+"""
+import math
+
+import numpy as np
+import pandas as pd
+
+from dldata.periods import MONTH_ORDINAL, NEPALI_MONTHS
+from dldata.schema import SCHEMA_DTYPES
+
+# Shape of the real data the scale is measured against
+BASE_BANKS = 20
+BASE_PERIODS = 115
+
+# Weeks reported per month before the month-end row
+WEEKS = ["1st Week", "2nd Week", "3rd Week", "4th Week"]
+
+LAST_FISCAL_YEAR = 2081
+LAST_DATE = np.datetime64("2025-07-16", "D")
+
+
+def _periods(count: int) -> pd.DataFrame:
+    """The last ``count`` weekly and month-end periods up to ``LAST_FISCAL_YEAR``."""
+    per_year = len(NEPALI_MONTHS) * (len(WEEKS) + 1)
+    years = math.ceil(count / per_year)
+    rows = []
+    for fiscal_year in range(LAST_FISCAL_YEAR - years + 1, LAST_FISCAL_YEAR + 1):
+        for month in NEPALI_MONTHS:
+            year = fiscal_year + (MONTH_ORDINAL[month] >= MONTH_ORDINAL["Baisakh"])
+            for week in WEEKS + ["End Date"]:
+                rows.append((fiscal_year, year, month, week))
+    periods = pd.DataFrame(rows[-count:], columns=["fiscal_year", "Year", "Month", "Week"])
+
+    # One period every 6 days keeps four weeks and a month end inside a month
+    periods["Date"] = LAST_DATE - np.arange(len(periods))[::-1] * 6
+    periods["type"] = np.where(periods["Week"] == "End Date", "End", "Week")
+    periods["FY"] = periods["fiscal_year"].astype(str) + "/" + ((periods["fiscal_year"] + 1) % 100).astype(str).str.zfill(2)
+    bs_month = (periods["Month"].map(MONTH_ORDINAL) + 2) % 12 + 1
+    day = periods["Week"].map({"1st Week": 7, "2nd Week": 14, "3rd Week": 21, "4th Week": 28, "End Date": 29})
+    periods["Ndate"] = bs_month.astype(str) + "/" + day.astype(str) + "/" + periods["Year"].astype(str)
+    return periods
+
+
+def synthetic_schema(scale: float = 1, seed: int = 0) -> pd.DataFrame:
+    """A Schema.csv-like frame with about ``scale`` times the real data's rows."""
+    rng = np.random.default_rng(seed)
+    bank_factor = max(round(math.sqrt(scale)), 1)
+    banks = [f"Synthetic Bank {i:03d} Ltd" for i in range(BASE_BANKS * bank_factor)]
+    periods = _periods(max(round(BASE_PERIODS * scale / bank_factor), 1))
+
+    n_periods, n_banks = len(periods), len(banks)
+    start = rng.uniform(50, 600, size=n_banks)
+    walk = np.cumprod(1 + rng.normal(0.002, 0.01, size=(n_periods, n_banks)), axis=0)
+    dlcy = np.round(start * walk, 2)
+    dfcy = np.round(rng.uniform(0, 0.05, size=(n_periods, n_banks)) * dlcy, 2)
+    cd = rng.uniform(0.7, 0.9, size=(n_periods, n_banks))
+    llcy = np.round(dlcy * cd, 2)
+    lfcy = np.round(dfcy * rng.uniform(0.5, 1.0, size=(n_periods, n_banks)), 2)
+
+    frame = periods.loc[np.repeat(np.arange(n_periods), n_banks)].reset_index(drop=True)
+    frame["Bank"] = np.tile(banks, n_periods)
+    for name, values in (("DLCY", dlcy), ("DFCY", dfcy), ("LLCY", llcy), ("LFCY", lfcy)):
+        frame[name] = values.ravel()
+    frame["DTOTAL"] = np.round(frame["DLCY"] + frame["DFCY"], 2)
+    frame["LTOTAL"] = np.round(frame["LLCY"] + frame["LFCY"], 2)
+    frame["CD"] = np.round(frame["LTOTAL"] / frame["DTOTAL"], 4)
+
+    columns = ["Date", "FY", "Year", "Month", "Week", "type", "Ndate", "Bank",
+               "DLCY", "DFCY", "DTOTAL", "LLCY", "LFCY", "LTOTAL", "CD"]
+    return frame[columns].astype(SCHEMA_DTYPES)
+
+
+def write_csv(df: pd.DataFrame, path: str) -> None:
+    """Write ``df`` in Schema.csv's layout, so ``read_csv`` can load it."""
+    df.to_csv(path, index=False, date_format="%m/%d/%Y")
@@ -0,0 +1,165 @@
+"""Lightweight timing spans for the dashboard's hot paths.
+
+A dashboard rerun is timed with ``rerun(name)``. Inside it, ``span`` blocks
+and ``@timed`` functions record how long each step took: the parse, the
+rollups, the page derivations, figure construction and every
+``st.dataframe`` / ``st.plotly_chart`` call::
+
+    with timing.rerun("Weekly DL Data") as record:
+        with timing.span("figure:weekly_growth"):
+            ...
+
+Each span name keeps a rolling window of its last ``WINDOW`` durations.
+``percentiles()`` summarizes them and ``histograms()`` counts them into the
+``BUCKETS_MS`` latency buckets, so a span that is slow on every rerun can be
+told apart from one that is only slow now and then. ``dldata.metrics``
+exports the spans as a Prometheus histogram with the same bounds. When the
+``DLDATA_TIMING_LOG`` environment variable names a file, every finished rerun
+is appended to it as one JSON line::
+
+    {"time": "2025-07-16T10:00:00", "rerun": "Weekly DL Data", "ms": 41.2,
+     "spans": [{"name": "dataset:weeks", "start_ms": 0.1, "ms": 0.2, "depth": 0}, ...]}
+
+Spans are tracked per thread, which in Streamlit means per script run, and
+cost about a microsecond each, so they stay on outside the debug panel too.
+A ``rerun`` opened inside another one, like a fragment during a full rerun,
+is recorded as a span of the outer rerun.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+LOG_ENV = "DLDATA_TIMING_LOG"
+
+# Durations kept per span name for the rolling percentiles
+WINDOW = 500
+PERCENTILES = (50, 90, 99)
+# Upper bounds of the histogram buckets, in ms; a last bucket takes the slower calls
+BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Timings:
+    def __init__(self, window: int = WINDOW, log_path: str = None):
+        self.window = window
+        self.log_path = log_path
+        # Called with every finished rerun's record
+        self.listeners = []
+        self._samples = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _add(self, name: str, ms: float) -> None:
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+            samples.append(ms)
+
+    @contextmanager
+    def span(self, name: str):
+        """Time the block as ``name``, nested under any open span of this thread."""
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+            local.depth = depth
+            self._add(name, ms)
+            record = getattr(local, "record", None)
+            if record is not None:
+                record["spans"].append({
+                    "name": name,
+                    "start_ms": round((start - local.started) * 1000, 3),
+                    "ms": round(ms, 3),
+                    "depth": depth,
+                })
+
+    @contextmanager
+    def rerun(self, name: str):
+        """Collect the spans of one rerun and yield its record.
+
+        The record is filled in when the block ends: ``ms`` is the rerun's
+        duration and ``spans`` lists its spans in start order.
+        """
+        local = self._local
+        if getattr(local, "record", None) is not None:
+            with self.span(name):
+                yield local.record
+            return
+
+        record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "rerun": name, "ms": None, "spans": []}
+        local.record, local.depth, local.started = record, 0, time.perf_counter()
+        try:
+            yield record
+        finally:
+            ms = (time.perf_counter() - local.started) * 1000
+            local.record = None
+            record["ms"] = round(ms, 3)
+            record["spans"].sort(key=lambda s: (s["start_ms"], s["depth"]))
+            self._add(f"rerun:{name}", ms)
+            self._write(record)
+            for listener in self.listeners:
+                listener(record)
+
+    def _write(self, record: dict) -> None:
+        if not self.log_path:
+            return
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def percentiles(self, q: tuple = PERCENTILES) -> dict:
+        """``{span: {"count": n, "p50": ms, ...}}`` over each span's rolling window."""
+        with self._lock:
+            samples = {name: np.array(values) for name, values in self._samples.items()}
+        return {
+            name: {"count": len(values), **{f"p{p}": float(v) for p, v in zip(q, np.percentile(values, q))}}
+            for name, values in sorted(samples.items())
+        }
+
+    def histograms(self, buckets: tuple = BUCKETS_MS) -> dict:
+        """``{span: counts}`` over each span's rolling window.
+
+        ``counts[i]`` is the number of calls that took at most ``buckets[i]``
+        ms and more than the bound before it; the last count is the calls over
+        ``buckets[-1]``.
+        """
+        with self._lock:
+            samples = {name: np.array(values) for name, values in self._samples.items()}
+        return {
+            name: np.bincount(np.searchsorted(buckets, values, side="left"), minlength=len(buckets) + 1)
+            for name, values in sorted(samples.items())
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+TIMINGS = Timings(log_path=os.environ.get(LOG_ENV) or None)
+
+span = TIMINGS.span
+rerun = TIMINGS.rerun
+percentiles = TIMINGS.percentiles
+histograms = TIMINGS.histograms
+
+
+def timed(fn):
+    """Record every call of ``fn`` as a span named ``<module>.<function>``."""
+    name = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with span(name):
+            return fn(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,165 @@
+"""Integrity checks on per-bank schema rows.
+
+Every check is a vectorized mask over the whole frame, so validating a data
+version costs a few array passes. The result is a report with one row per
+offending input row and check. The rollups recompute DTOTAL and LTOTAL from
+their LCY + FCY parts, so a reported total that doesn't match its parts is
+listed but doesn't change the dashboard's numbers.
+
+Reports are computed once per data version. New periods are checked before
+they enter the store, and a CSV can be checked by hand with::
+
+    python -m dldata.validate [Schema.csv]
+"""
+import logging
+import sys
+
+import numpy as np
+import pandas as pd
+
+from dldata.nepali_calendar import AD_EPOCH, fiscal_month, fiscal_year, parse_ndate
+from dldata.periods import MONTH_ORDINAL, WEEK_ORDINAL, period_keys
+from dldata.schema import DATA_FILE, MEASURE_COLUMNS, TOTAL_PARTS
+from dldata.source import data_version, read_csv
+from dldata.timing import timed
+
+logger = logging.getLogger(__name__)
+
+# Amounts are published with two decimals
+TOTAL_TOLERANCE = 0.011
+
+# Checks whose failures stop rows from being ingested; the rest are reported only.
+# Reported totals are recomputed from their parts, so a mismatch isn't an error.
+ERROR_CHECKS = ("missing value", "duplicate bank", "unknown label", "type/week mismatch", "FY mismatch")
+
+REPORT_COLUMNS = ["Check", "Row", "Year", "Month", "Week", "Bank", "Detail"]
+
+# Reports of the last few data versions, like the dataset caches
+REPORT_MEMO_SIZE = 2
+_report_memo = {}
+
+
+def _fiscal_year_labels(start_years: np.ndarray) -> np.ndarray:
+    # 2081 -> "2081/82"
+    return np.char.add(np.char.add(start_years.astype(str), "/"), np.char.zfill(((start_years + 1) % 100).astype(str), 2))
+
+
+def _checks(df: pd.DataFrame):
+    """Yield ``(check, mask, detail)`` for every integrity check."""
+    measures = df[MEASURE_COLUMNS].astype("float64")
+    missing = measures.isna()
+    yield "missing value", missing.any(axis=1).to_numpy(), "missing " + missing.dot(missing.columns + " ").str.strip()
+
+    for total, parts in TOTAL_PARTS:
+        gap = measures[total] - measures[parts].sum(axis=1)
+        yield "total mismatch", (gap.abs() > TOTAL_TOLERANCE).to_numpy(), (
+            f"{total} - ({' + '.join(parts)}) = " + gap.round(2).astype(str)
+        )
+
+    month = df["Month"].astype(str).fillna("missing")
+    week = df["Week"].astype(str).fillna("missing")
+    known = month.isin(MONTH_ORDINAL).to_numpy() & week.isin(WEEK_ORDINAL).to_numpy()
+    yield "unknown label", ~known, "Month " + month + ", Week " + week
+
+    # Month-end rows are exactly the "End Date" rows
+    end_type = (df["type"].astype(str) == "End").to_numpy()
+    end_week = (week == "End Date").to_numpy()
+    yield "type/week mismatch", end_type != end_week, "type " + df["type"].astype(str) + " with Week " + week
+
+    if not known.all():
+        # The remaining checks need period keys, which unknown labels don't have
+        return
+    keys = period_keys(df)
+    duplicated = pd.Series(keys, index=df.index).to_frame("Period").assign(Bank=df["Bank"]).duplicated(keep=False)
+    yield "duplicate bank", duplicated.to_numpy(), "bank listed more than once in the period"
+
+    # Every bank of a period should report in the next one too, or the next
+    # period's industry totals drop; flag the bank's row in the last period it reported
+    period_list, first_row, period = np.unique(keys, return_index=True, return_inverse=True)
+    bank, banks = pd.factorize(df["Bank"], use_na_sentinel=False)
+    reported = np.zeros((len(period_list) + 1, len(banks)), dtype=bool)
+    reported[-1] = True  # nothing is expected after the last period
+    reported[period, bank] = True
+    labels = (df["Year"].astype(str) + " " + month + " " + week).to_numpy()[first_row]
+    next_label = np.append(labels[1:], "")[period]
+    yield "missing bank", ~reported[period + 1, bank], "bank missing from " + pd.Series(next_label, index=df.index)
+
+    expected_fy = _fiscal_year_labels(keys // 1000)
+    yield "FY mismatch", df["FY"].astype(str).to_numpy() != expected_fy, "FY " + df["FY"].astype(str) + ", expected " + expected_fy
+
+    bs = parse_ndate(df["Ndate"])
+    invalid = bs["BS Ordinal"].isna().to_numpy()
+    yield "invalid Ndate", invalid, "Ndate " + df["Ndate"].fillna("missing").astype(str)
+
+    ad_days = (df["Date"].to_numpy().astype("datetime64[D]") - AD_EPOCH).astype(np.int64)
+    offset = ad_days - bs["BS Ordinal"].to_numpy(dtype=np.int64, na_value=0)
+    yield "Ndate/Date mismatch", ~invalid & (offset != 0), "Date - Ndate = " + pd.Series(offset, index=df.index).astype(str) + " day(s)"
+
+    # The Ndate's fiscal year and month, against the period's labels
+    bs_year = bs["BS Year"].to_numpy(dtype=np.int32, na_value=0)
+    bs_month = bs["BS Month"].to_numpy(dtype=np.int32, na_value=0)
+    ndate_month = fiscal_year(bs_year, bs_month) * 100 + fiscal_month(bs_month)
+    yield "Ndate/period mismatch", ~invalid & (ndate_month != keys // 10), (
+        "Ndate " + df["Ndate"].astype(str) + " is outside " + month + " of FY " + pd.Series(expected_fy, index=df.index)
+    )
+
+
+@timed
+def check(df: pd.DataFrame) -> pd.DataFrame:
+    """Report of every failed check, one row per offending row and check.
+
+    ``Row`` is the row's position in ``df``.
+    """
+    parts = []
+    for name, mask, detail in _checks(df):
+        if not mask.any():
+            continue
+        rows = np.flatnonzero(mask)
+        detail = detail.iloc[rows].to_numpy() if isinstance(detail, pd.Series) else detail
+        parts.append(pd.DataFrame({
+            "Check": name,
+            "Row": rows,
+            "Year": df["Year"].iloc[rows].to_numpy(),
+            "Month": df["Month"].iloc[rows].astype(str).to_numpy(),
+            "Week": df["Week"].iloc[rows].astype(str).to_numpy(),
+            "Bank": df["Bank"].iloc[rows].astype(str).to_numpy(),
+            "Detail": detail,
+        }))
+    if not parts:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+    return pd.concat(parts, ignore_index=True).sort_values(["Row", "Check"], ignore_index=True)
+
+
+def errors(report: pd.DataFrame) -> pd.DataFrame:
+    """The rows of ``report`` that should keep data out of the store."""
+    return report[report["Check"].isin(ERROR_CHECKS)]
+
+
+def report(df: pd.DataFrame, version: str) -> pd.DataFrame:
+    """``check(df)``, computed once per data version."""
+    if version not in _report_memo:
+        result = check(df)
+        if len(result):
+            logger.warning("data version %s: %d integrity issues (%s)", version, len(result),
+                           ", ".join(f"{n} {c}" for c, n in result["Check"].value_counts().items()))
+        while len(_report_memo) >= REPORT_MEMO_SIZE:
+            # Dicts keep insertion order, so this drops the oldest version
+            del _report_memo[next(iter(_report_memo))]
+        _report_memo[version] = result
+    return _report_memo[version]
+
+
+def main(argv) -> int:
+    path = argv[1] if len(argv) > 1 else DATA_FILE
+    result = report(read_csv(path), data_version(path))
+    if result.empty:
+        print(f"{path}: no issues")
+        return 0
+    with pd.option_context("display.max_rows", None, "display.width", 200, "display.max_colwidth", 60):
+        print(result.to_string(index=False))
+    print(f"{path}: {len(result)} issues, {len(errors(result))} errors")
+    return 1 if len(errors(result)) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
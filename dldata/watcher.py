@@ -0,0 +1,111 @@
+"""Background watcher that swaps in new data versions once they are built.
+
+Without it, the first rerun after Schema.csv (or the store) changes finds a
+new version, and that session waits while every dataset is parsed and
+rebuilt. ``DataWatcher`` polls the source's version from a daemon thread
+instead. When the version changes, it calls ``prepare(version)`` to build
+everything for the new version off the request path, and only then makes it
+the current ``version``. Readers never see a version whose datasets are
+still being built, and a failed build keeps the previous version current::
+
+    watcher = DataWatcher(prepare)
+    watcher.start()
+    ...
+    frames = datasets_for(watcher.version)
+
+The swap is a single attribute assignment, so it is atomic. Readers that
+need several datasets of one version, like a dashboard rerun, should read
+``version`` once and use that value throughout.
+
+``on_swap(previous, version)``, if given, is called after each swap, e.g. to
+drop caches of versions that are no longer served.
+
+The first version is taken as it is, without calling ``prepare``, so
+startup still builds only what the first readers ask for. The poll interval
+comes from ``DLDATA_WATCH_INTERVAL`` (seconds, default 5). With an interval
+of 0 no thread is started and ``version`` checks the source on every read,
+leaving the builds on the request path as before.
+"""
+import logging
+import os
+import threading
+import time
+
+from dldata import metrics
+from dldata.pipeline import data_source, source_version
+
+logger = logging.getLogger(__name__)
+
+INTERVAL_ENV = "DLDATA_WATCH_INTERVAL"
+INTERVAL = 5.0
+
+
+class DataWatcher:
+    def __init__(self, prepare, interval: float = None, source: str = None, on_swap=None):
+        self.prepare = prepare      # builds everything for a version; called before it goes live
+        self.on_swap = on_swap      # called with (previous, version) once a version is live
+        self.interval = float(os.environ.get(INTERVAL_ENV, INTERVAL)) if interval is None else interval
+        self.source = source        # None follows data_source(), so a newly created store is picked up
+        self._version = None
+        self._failed = None         # version whose prepare failed, not retried until the source changes again
+        self._check_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def version(self) -> str:
+        """The current data version; a new version becomes current once it is prepared."""
+        if self._version is None or not self.running:
+            # No version yet, or no thread to prepare the next one
+            self.check(prepare=False)
+        return self._version
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def check(self, prepare: bool = True) -> bool:
+        """Prepare and swap in the source's version if it changed; True if it was swapped."""
+        with self._check_lock:
+            version = source_version(self.source or data_source())
+            if version == self._version or version == self._failed:
+                return False
+            start = time.perf_counter()
+            try:
+                if prepare:
+                    self.prepare(version)
+            except Exception:
+                self._failed = version
+                logger.exception("data version %s failed to build; keeping %s", version, self._version)
+                return False
+            previous, self._version = self._version, version
+            metrics.inc("dldata_data_swaps_total")
+            logger.info("data version %s is live (was %s) after %.1f s", version, previous, time.perf_counter() - start)
+            if self.on_swap is not None and previous is not None:
+                try:
+                    self.on_swap(previous, version)
+                except Exception:
+                    logger.exception("data version %s: swap callback failed", version)
+            return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                # Keep watching; the next poll tries again
+                logger.exception("data watcher check failed")
+
+    def start(self) -> "DataWatcher":
+        """Start polling from a daemon thread, unless the interval is 0."""
+        if self.interval > 0 and not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="dldata-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from dldata.analytics import month_analytics
+from dldata.periods import NEPALI_MONTHS, period_key
+
+
+def _months(fiscal_years: list, bank: str = None) -> pd.DataFrame:
+    rows = []
+    for fiscal_year in fiscal_years:
+        for i, month in enumerate(NEPALI_MONTHS):
+            year = fiscal_year + (month in ("Baisakh", "Jestha", "Ashar"))
+            rows.append({"Period": period_key(year, month, "End Date"), "Month": month, "FY": fiscal_year})
+    frame = pd.DataFrame(rows)
+    # DTOTAL grows by 10 a month from 100, so every change is known
+    frame["DTOTAL"] = 100.0 + 10 * np.arange(len(frame))
+    frame["LTOTAL"] = frame["DTOTAL"] / 2
+    frame["CD"] = 50.0
+    if bank is not None:
+        frame["Bank"] = bank
+    return frame
+
+
+def test_fytd_starts_from_the_previous_fiscal_year_close():
+    result = month_analytics(_months([2080, 2081])).set_index(["FY", "Month"])
+
+    # The first FY has nothing before it
+    assert np.isnan(result.loc[(2080, "Shrawan"), "DTOTAL Change"])
+    assert np.isnan(result.loc[(2080, "Shrawan"), "DTOTAL FYTD"])
+
+    # Shrawan is compared with the previous Ashar (210), not left out
+    shrawan = result.loc[(2081, "Shrawan")]
+    assert shrawan["DTOTAL Change"] == 10
+    assert shrawan["DTOTAL FYTD"] == 10
+    assert shrawan["DTOTAL Change %"] == shrawan["DTOTAL FYTD %"] == 10 / 210 * 100
+
+    ashar = result.loc[(2081, "Ashar")]
+    assert ashar["DTOTAL FYTD"] == ashar["DTOTAL YoY"] == 120
+    assert ashar["DTOTAL FYTD %"] == ashar["DTOTAL YoY %"]
+
+
+def test_fytd_does_not_cross_banks():
+    frame = pd.concat([_months([2081], "A"), _months([2081], "B")], ignore_index=True)
+    result = month_analytics(frame, group="Bank")
+    first = result[result["Month"] == "Shrawan"]
+    assert first["DTOTAL Change"].isna().all()
+    assert first["DTOTAL FYTD"].isna().all()
+    assert (result.loc[result["Month"] == "Ashar", "DTOTAL FYTD"].isna()).all()
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from views.charts import MAX_POINTS, large_series
+
+
+def test_large_px_line_is_downsampled():
+    # Over 1000 rows, so Plotly Express already emits a scattergl trace
+    n = 5000
+    frame = pd.DataFrame({"x": np.arange(n), "y": np.cumsum(np.random.default_rng(0).normal(size=n))})
+    figure = px.line(frame, x="x", y="y")
+    assert figure.data[0].type == "scattergl"
+
+    trace = large_series(figure).data[0]
+    assert trace.type == "scattergl"
+    assert len(trace.x) == len(trace.y) == MAX_POINTS
+    # The endpoints and the extreme of the series survive downsampling
+    assert trace.x[0] == 0 and trace.x[-1] == n - 1
+    assert frame["y"].max() in trace.y
+
+
+def test_small_figure_is_untouched():
+    frame = pd.DataFrame({"x": list("abcde"), "y": [1.0, 2.0, 3.0, 2.0, 1.0]})
+    figure = px.line(frame, x="x", y="y", markers=True, text="y", line_shape="spline")
+    trace = large_series(figure).data[0]
+    assert trace.type == "scatter"
+    assert len(trace.x) == 5 and "text" in trace.mode
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from dldata.matrix import BankMatrix
+
+
+def _matrix():
+    # Bank B has no FCY deposits until the last period; C stops reporting after the first
+    frame = pd.DataFrame({
+        "Bank": ["A", "B", "C", "A", "B", "A", "B"],
+        "Period": [2081011, 2081011, 2081011, 2081021, 2081021, 2081031, 2081031],
+        "DTOTAL": [100.0, 50.0, 50.0, 110.0, 60.0, 120.0, 80.0],
+        "DFCY": [10.0, 0.0, 5.0, 12.0, 0.0, 15.0, 4.0],
+        "CD": [80.0, 70.0, 90.0, 82.0, 71.0, 84.0, 72.0],
+    })
+    return BankMatrix.build(frame, measures=["DTOTAL", "DFCY", "CD"])
+
+
+def test_range_change_and_shares():
+    matrix = _matrix()
+    result = matrix.range_change(matrix.columns(2081011, 2081031)).set_index(["Measure", "Bank"])
+
+    a = result.loc[("DTOTAL", "A")]
+    assert (a["Start"], a["End"], a["Change"], a["Change %"]) == (100, 120, 20, 20)
+    assert a["Share Start"] == 50 and a["Share End"] == 60
+    assert np.isclose(a["Share Shift"], 10)
+
+    # C's last reported period is the first one
+    c = result.loc[("DTOTAL", "C")]
+    assert c["Start"] == c["End"] == 50 and c["Change"] == 0
+
+    assert result.loc[("CD", "A"), "Change"] == 4
+    assert np.isnan(result.loc[("CD", "A"), "Share Start"])
+
+
+def test_change_pct_from_zero_is_nan():
+    matrix = _matrix()
+    result = matrix.range_change(matrix.columns(2081011, 2081031)).set_index(["Measure", "Bank"])
+    b = result.loc[("DFCY", "B")]
+    assert b["Change"] == 4
+    assert np.isnan(b["Change %"])
+    assert not np.isinf(result["Change %"]).any()
+
+
+def test_range_change_of_an_empty_range():
+    matrix = _matrix()
+    assert matrix.range_change(matrix.columns(2082011, 2082031)).empty
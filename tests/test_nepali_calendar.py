@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from dldata.nepali_calendar import AD_EPOCH, ad_to_bs, bs_to_ad, fiscal_month, fiscal_year
+
+
+def test_bs_ad_round_trip():
+    dates = AD_EPOCH + np.arange(0, 3 * 365, 7)
+    year, month, day = ad_to_bs(dates)
+    assert (bs_to_ad(year, month, day) == dates).all()
+    # 1 Shrawan 2081 (16 July 2024) starts fiscal year 2081/82
+    assert bs_to_ad(2081, 4, 1) == np.datetime64("2024-07-16")
+
+
+def test_out_of_range_dates():
+    assert np.isnat(bs_to_ad(2079, 12, 30))
+    assert np.isnat(bs_to_ad(2081, 1, 32))
+    with pytest.raises(ValueError):
+        ad_to_bs(np.array(["2023-04-13"], dtype="datetime64[D]"))
+
+
+def test_fiscal_year_and_month():
+    months = np.arange(1, 13)
+    assert fiscal_year(np.full(12, 2081), months).tolist() == [2080] * 3 + [2081] * 9
+    assert fiscal_month(months).tolist() == [10, 11, 12] + list(range(1, 10))
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from dldata.periods import NEPALI_MONTHS, UNKNOWN_PERIOD, WEEK_ORDINAL, key_slice, month_span, period_key, period_keys
+
+
+def test_keys_sort_chronologically():
+    # Baisakh-Ashar 2081 close FY 2080/81, so they come before Shrawan 2081
+    chronological = [
+        (2080, "Chaitra", "End Date"),
+        (2081, "Baisakh", "1st Week"),
+        (2081, "Ashar", "End Date"),
+        (2081, "Shrawan", "1st Week"),
+        (2081, "Shrawan", "5th Week"),
+        (2081, "Shrawan", "End Date"),
+        (2081, "Bhadra", "1st Week"),
+        (2082, "Baisakh", "2nd Week"),
+    ]
+    keys = [period_key(*period) for period in chronological]
+    assert keys == sorted(keys)
+    assert period_key(2081, "Shrawan", "End Date") == 2081019
+    assert period_key(2081, "Ashar", "End Date") == 2080129
+
+
+def test_vectorized_keys_match_period_key():
+    rows = [(year, month, week) for year in (2081, 2082) for month in NEPALI_MONTHS for week in WEEK_ORDINAL]
+    frame = pd.DataFrame(rows, columns=["Year", "Month", "Week"])
+    expected = [period_key(*row) for row in rows]
+    assert period_keys(frame).tolist() == expected
+    categorical = frame.astype({"Month": "category", "Week": "category"})
+    assert period_keys(categorical).tolist() == expected
+
+
+def test_unknown_and_missing_labels_get_the_sentinel():
+    frame = pd.DataFrame({
+        "Year": [2081, 2081, 2081, 2081],
+        "Month": ["Shrawan", "Sawan?", None, "Ashar"],
+        "Week": ["1st Week", "1st Week", "End Date", None],
+    }).astype({"Month": "category", "Week": "category"})
+    keys = period_keys(frame)
+    assert keys.tolist() == [period_key(2081, "Shrawan", "1st Week")] + [UNKNOWN_PERIOD] * 3
+
+
+def test_month_span_slices_sorted_keys():
+    keys = np.array(sorted(period_key(2081, month, week) for month in NEPALI_MONTHS for week in WEEK_ORDINAL))
+    selected = keys[key_slice(keys, month_span(2081, "Bhadra")[0], month_span(2081, "Kartik")[1])]
+    assert len(selected) == 3 * len(WEEK_ORDINAL)
+    assert selected[0] == period_key(2081, "Bhadra", "1st Week")
+    assert selected[-1] == period_key(2081, "Kartik", "End Date")
+    assert len(keys[key_slice(keys, 2090000, 2091000)]) == 0
@@ -0,0 +1,41 @@
+import pandas as pd
+
+from dldata.search import SearchIndex
+
+
+def _index():
+    periods = pd.DataFrame({
+        "Year": [2081, 2081, 2081, 2082],
+        "Month": ["Shrawan", "Shrawan", "Baisakh", "Baisakh"],
+        "Week": ["1st Week", "End Date", "2nd Week", "1st Week"],
+        "FY": ["2081/82", "2081/82", "2080/81", "2081/82"],
+        "Date": pd.to_datetime(["2024-07-22", "2024-08-15", "2024-04-28", "2025-04-20"]),
+        "Ndate": ["4/7/2081", "4/31/2081", "1/15/2081", "1/7/2082"],
+    })
+    periods["Description"] = periods["Year"].astype(str) + " " + periods["Month"] + " " + periods["Week"]
+    periods["Long Date"] = periods["Date"].dt.strftime("%B %d, %Y")
+    return SearchIndex.build(periods)
+
+
+def test_terms_intersect_within_a_field():
+    index = _index()
+    assert index.search("2081 Baisakh").tolist() == [2]
+    assert index.search("shrawan 1st").tolist() == [0]
+    # "2081" and "August" only occur together in row 1's long date
+    assert index.search("August 2024").tolist() == [1]
+    assert index.search("Baisakh End").tolist() == []
+
+
+def test_terms_match_inside_tokens():
+    index = _index()
+    assert index.search("81/82").tolist() == [0, 1, 3]
+    assert index.search("/2081").tolist() == [0, 1, 2]
+    assert index.search("st Week").tolist() == [0, 3]
+    assert index.search("-04-2").tolist() == [2, 3]
+
+
+def test_aliases_and_suggestions():
+    index = _index()
+    assert index.search("baishakh").tolist() == [2, 3]
+    assert index.suggest("2082 Bai") == ["2082 Baisakh", "2082 Baishakh"]
+    assert index.suggest("2081 ") == []
@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dldata import cube, store
+from dldata.periods import period_keys
+from dldata.source import StaleVersionError, data_version
+from dldata.synthetic import synthetic_schema, write_csv
+
+
+@pytest.fixture
+def split(tmp_path):
+    """Synthetic rows, the path of a CSV of all but their last two periods, and those periods."""
+    df = synthetic_schema(0.5)
+    keys = period_keys(df)
+    new = np.isin(keys, np.unique(keys)[-2:])
+    csv_path = str(tmp_path / "Schema.csv")
+    write_csv(df[~new], csv_path)
+    return df, csv_path, df[new].reset_index(drop=True)
+
+
+def _periods(path: str) -> int:
+    return sum(len(entry["periods"]) for entry in store.read_manifest(path)["fiscal_years"].values())
+
+
+def test_ingest_appends_periods_and_chains_the_version(tmp_path, split):
+    df, csv_path, new_rows = split
+    path = str(tmp_path / "store")
+    initial = store.init_store(csv_path, path)
+    assert initial["version"] == data_version(csv_path)
+    before = _periods(path)
+
+    manifest = store.ingest(new_rows, path)
+    assert manifest["version"] == store._next_version(initial["version"], new_rows)
+    assert store.store_version(path) == manifest["version"]
+    assert _periods(path) == before + 2
+
+    rows = store.read_rows(path, manifest["version"])
+    assert len(rows) == len(df)
+    assert (np.diff(period_keys(rows)) >= 0).all()
+
+    # The stored totals match a rebuild from all the rows
+    expected = cube.build_periods(cube.cd_percent(df))
+    periods = store.read_periods(path, manifest["version"])
+    assert periods["Period"].tolist() == expected["Period"].tolist()
+    assert np.allclose(periods["DTOTAL"], expected["DTOTAL"])
+
+    # Only the current aggregates of each fiscal year are kept
+    for fiscal_year, entry in manifest["fiscal_years"].items():
+        aggregates = [name for name in os.listdir(os.path.join(path, fiscal_year)) if name.startswith("periods-")]
+        assert aggregates == [entry["aggregates"]]
+
+    with pytest.raises(StaleVersionError):
+        store.read_rows(path, initial["version"])
+
+
+def test_reingest_is_refused(tmp_path, split):
+    _, csv_path, new_rows = split
+    path = str(tmp_path / "store")
+    store.init_store(csv_path, path)
+    manifest = store.ingest(new_rows, path)
+
+    with pytest.raises(ValueError, match="already in the store"):
+        store.ingest(new_rows, path)
+    # A batch that repeats one stored period is refused as a whole; the
+    # shifted copy's FY labels don't match, so skip validation
+    with pytest.raises(ValueError, match="already in the store"):
+        store.ingest(pd.concat([new_rows, new_rows.assign(Year=new_rows["Year"] + 5)]), path, allow_invalid=True)
+    assert store.read_manifest(path) == manifest
+
+    with pytest.raises(ValueError, match="already holds a store"):
+        store.init_store(csv_path, path)
+
+
+def test_invalid_rows_are_refused(tmp_path, split):
+    _, csv_path, new_rows = split
+    path = str(tmp_path / "store")
+    store.init_store(csv_path, path)
+    duplicated = pd.concat([new_rows, new_rows.iloc[:1]], ignore_index=True)
+    with pytest.raises(ValueError, match="failed validation"):
+        store.ingest(duplicated, path)
@@ -0,0 +1,24 @@
+from dldata import metrics
+from dldata.timing import Timings
+
+
+def test_histograms_count_the_rolling_window():
+    timings = Timings(window=4)
+    for ms in (0.2, 0.5, 3, 20000, 7):
+        timings._add("span", ms)
+    counts = timings.histograms(buckets=(0.5, 5, 10))
+    # 0.2 fell out of the window; a call on a bound counts in that bucket
+    assert counts["span"].tolist() == [1, 1, 1, 1]
+    assert timings.percentiles()["span"]["count"] == 4
+
+
+def test_rerun_spans_are_exported_as_a_histogram():
+    timings = Timings()
+    timings.listeners.append(metrics._record_rerun)
+    with timings.rerun("Test page"):
+        with timings.span("figure:test"):
+            pass
+    text = metrics.render()
+    assert '# TYPE dldata_span_duration_seconds histogram' in text
+    assert 'dldata_span_duration_seconds_count{span="figure:test"} 1' in text
+    assert 'dldata_span_duration_seconds_bucket{le="+Inf",span="figure:test"} 1' in text
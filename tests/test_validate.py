@@ -0,0 +1,29 @@
+from dldata import validate
+from dldata.synthetic import synthetic_schema
+
+
+def _checks(report):
+    return set(report["Check"])
+
+
+def test_bank_missing_from_a_period_is_reported():
+    df = synthetic_schema(0.5)
+    periods = df.groupby(["Year", "Month", "Week"], observed=True, sort=False).ngroup()
+    bank = df["Bank"].iloc[0]
+    dropped = df[~((periods == 3) & (df["Bank"] == bank))].reset_index(drop=True)
+
+    assert "missing bank" not in _checks(validate.check(df))
+    missing = validate.check(dropped).query("Check == 'missing bank'")
+    # Flagged once, on the bank's row of the period before the gap
+    assert len(missing) == 1
+    row = missing.iloc[0]
+    assert row["Bank"] == bank
+    assert dropped.loc[row["Row"], "Bank"] == bank
+    assert validate.errors(missing).empty
+
+
+def test_reports_are_kept_for_the_last_versions_only():
+    df = synthetic_schema(0.1)
+    for version in ("a", "b", "c"):
+        validate.report(df, version)
+    assert list(validate._report_memo) == ["b", "c"]
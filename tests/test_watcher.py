@@ -0,0 +1,20 @@
+from dldata.figure_cache import FigureCache
+from dldata.watcher import DataWatcher
+
+
+def test_swap_keeps_figures_of_the_live_and_previous_versions(tmp_path):
+    source = tmp_path / "Schema.csv"
+    cache = FigureCache()
+    watcher = DataWatcher(lambda version: None, interval=0, source=str(source),
+                          on_swap=lambda previous, version: cache.keep_versions(previous, version))
+
+    versions = []
+    # Different sizes, so the version memo sees every change
+    for content in ("a", "bb", "ccc"):
+        source.write_text(content)
+        watcher.check()
+        versions.append(watcher.version)
+        cache.get_or_build((watcher.version, "chart"), object)
+
+    assert len(set(versions)) == 3
+    assert [key[0] for key in cache._figures] == versions[1:]
@@ -0,0 +1,82 @@
+"""Downscaled image variants served through Streamlit's static file serving.
+
+Images are converted once to WebP in ``static/`` and referenced by URL, so
+browsers fetch them over plain HTTP and revalidate them by ETag instead of
+receiving them inline with every rerun. File names carry the source image's
+content hash, so replacing an image changes its URL.
+
+When ``static/`` can't be written, e.g. on a read-only deploy, the original
+image is inlined as a data URL instead, as it was before the variants.
+"""
+import base64
+import logging
+import mimetypes
+import os
+
+import streamlit as st
+from PIL import Image
+
+from dldata.source import data_version
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = "static"
+STATIC_URL = "app/static"
+WEBP_QUALITY = 80
+
+# Sidebar logo, twice its 150px display width for high-DPI screens
+LOGO_FILE = "logo.png"
+LOGO_WIDTH = 300
+
+# Monthly report image on the Home page: a thumbnail that opens the full image
+REPORT_FILE = "latest.png"
+REPORT_THUMBNAIL_WIDTH = 640
+
+
+def build_variant(source: str, width: int = None, static_dir: str = STATIC_DIR) -> str:
+    """Write a WebP copy of ``source`` at most ``width`` pixels wide and return its file name."""
+    stem = os.path.splitext(os.path.basename(source))[0]
+    name = f"{stem}-{width or 'full'}-{data_version(source)}.webp"
+    path = os.path.join(static_dir, name)
+    if not os.path.exists(path):
+        os.makedirs(static_dir, exist_ok=True)
+        with Image.open(source) as image:
+            if width:
+                image.thumbnail((width, image.height), Image.LANCZOS)
+            # Write under a temporary name so a concurrent request never sees a partial file
+            tmp = f"{path}.{os.getpid()}.tmp"
+            image.save(tmp, format="WEBP", quality=WEBP_QUALITY, method=6)
+        os.replace(tmp, path)
+    return name
+
+
+def _data_url(source: str) -> str:
+    mime = mimetypes.guess_type(source)[0] or "application/octet-stream"
+    with open(source, "rb") as f:
+        return f"data:{mime};base64,{base64.b64encode(f.read()).decode()}"
+
+
+@st.cache_resource(show_spinner=False)
+def _image_url(source: str, width: int, version: str) -> str:
+    try:
+        return f"{STATIC_URL}/{build_variant(source, width)}"
+    except OSError as e:
+        logger.warning("serving %s inline, its variant couldn't be built: %s", source, e)
+        return _data_url(source)
+
+
+def image_url(source: str, width: int = None) -> str:
+    """Static URL of the ``width`` variant of ``source``, built on first use.
+
+    Falls back to a data URL of the original image if the variant can't be written.
+    """
+    return _image_url(source, width, data_version(source))
+
+
+def expandable_image(source: str, width: int, alt: str) -> str:
+    """HTML for a thumbnail of ``source`` that opens the full-size image when clicked."""
+    return (
+        f'<a href="{image_url(source)}" target="_blank" rel="noopener">'
+        f'<img src="{image_url(source, width)}" alt="{alt}" loading="lazy" '
+        f'style="width: {width}px; max-width: 100%; height: auto;"></a>'
+    )
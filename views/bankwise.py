@@ -0,0 +1,288 @@
+"""BankWise page: month-end figures per bank and bank comparisons.
+
+The panels read the bank × month-end matrix, so a bank's history is a row and
+a month across all banks is a column instead of a filter over the long frame.
+"""
+import plotly.express as px
+import streamlit as st
+
+from dldata import periods
+from views.shared import cached_figure, load_datasets, plotly_chart, timed_fragment
+from views.tables import show_table
+
+st.title("BankWise Data")
+
+# Each expander reruns on its own when its selectors change
+@timed_fragment
+def latest_month_panel():
+    matrix, = load_datasets("bank_matrix")
+    month_ends = matrix.info
+
+    # Find the last year and month in the DataFrame
+    last_year = month_ends['Year'].iloc[-1]
+    last_month = month_ends['Month'].iloc[-1]
+
+    # Create the selectboxes
+    chosen_year = st.selectbox("Choose Year", month_ends['Year'].unique(), index=list(month_ends['Year'].unique()).index(last_year))
+    chosen_month = st.selectbox("Choose Month", month_ends['Month'].unique(), index=list(month_ends['Month'].unique()).index(last_month))
+    st.header(f"As of {chosen_year} {chosen_month}")
+
+    # Every bank's column for the chosen month end
+    selected_date_entries = matrix.cross_section(periods.period_key(chosen_year, chosen_month, periods.MONTH_END))
+    show_table(
+        selected_date_entries,
+        key="latest_bank_table_page",
+        use_container_width=True,
+        column_config={
+            "Bank": {"title": "Bank Name"},
+            "DLCY": st.column_config.NumberColumn(
+                "Deposits LCY",
+                format="%.2f"
+            ),
+            "DFCY": st.column_config.NumberColumn(
+                "Deposit FCY",
+                format="%.2f"
+            ),
+            "DTOTAL": st.column_config.NumberColumn(
+                "Total Deposit",
+                format="%.2f"
+            ),
+            "LLCY": st.column_config.NumberColumn(
+                "Lending LCY",
+                format="%.2f"
+            ),
+            "LFCY": st.column_config.NumberColumn(
+                "Lending FCY",
+                format="%.2f"
+            ),
+            "LTOTAL": st.column_config.NumberColumn(
+                "Total Lending",
+                format="%.2f"
+            ),
+            "CD":st.column_config.NumberColumn(
+                "CD Ratio",
+                format="%.2f%%"
+
+            ),
+        },
+        column_order=["Bank","DLCY","DFCY","DTOTAL","LLCY","LFCY","LTOTAL","CD"]
+    )
+
+
+with st.expander("Click here for latest Monthly DL Data",expanded=False):
+    latest_month_panel()
+
+
+@timed_fragment
+def comparison_panel():
+    matrix, = load_datasets("bank_matrix")
+    month_ends = matrix.info
+
+    filtered_bank = st.multiselect("Choose a bank", matrix.banks.tolist(),default="Agricultural Development Bank Ltd",placeholder="Choose Banks for LineCharts")
+    st.write("Choose time period for comparison")
+
+    # Create two columns layout
+    from_column, to_column = st.columns(2)
+
+    # Selector options in chronological order, defaulting to the full history
+    year_options = sorted(month_ends['Year'].unique().tolist())
+    month_options = periods.month_options(month_ends)
+    first_month, last_month = month_ends.iloc[0], month_ends.iloc[-1]
+
+    # From Year and Month selection
+    with from_column:
+        from_year = st.selectbox("From Year", year_options, index=year_options.index(first_month['Year']))
+        from_month = st.selectbox("From Month", month_options, index=month_options.index(first_month['Month']))
+
+    # To Year and Month selection
+    with to_column:
+        to_year = st.selectbox("To Year", year_options, index=year_options.index(last_month['Year']))
+        to_month = st.selectbox("To Month", month_options, index=month_options.index(last_month['Month']))
+
+    # The selected date range is a slice of the matrix's columns
+    bank_range = (periods.month_span(from_year, from_month)[0], periods.month_span(to_year, to_month)[1])
+    bank_columns = matrix.columns(*bank_range)
+
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Deposit")
+        def bank_deposit_chart():
+            fig_dtotal = px.line(
+                matrix.long_frame("DTOTAL", filtered_bank, bank_columns, "ChartDate"),
+                x="ChartDate",
+                y="DTOTAL",
+                color="Bank",
+                line_shape="spline",
+                markers=True
+            )
+            fig_dtotal.update_layout(
+                xaxis_title="Date",
+                yaxis_title="Amount in Billions (Rs)",
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                )
+            )
+            return fig_dtotal
+
+        fig_dtotal = cached_figure("bank_deposit", bank_range + tuple(filtered_bank), bank_deposit_chart)
+        plotly_chart(fig_dtotal, use_container_width=True)
+
+    with col2:
+        st.subheader("Lending")
+        def bank_lending_chart():
+            fig_ltotal = px.line(
+                matrix.long_frame("LTOTAL", filtered_bank, bank_columns, "ChartDate"),
+                x="ChartDate",
+                y="LTOTAL",
+                color="Bank",
+                line_shape="spline",
+                markers=True
+            )
+            fig_ltotal.update_layout(
+                xaxis_title="Date",
+                yaxis_title="Amount in Billions (Rs)",
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                )
+            )
+            return fig_ltotal
+
+        fig_ltotal = cached_figure("bank_lending", bank_range + tuple(filtered_bank), bank_lending_chart)
+        plotly_chart(fig_ltotal, use_container_width=True)
+
+
+with st.expander("Compare bankwise data", expanded=True):
+    comparison_panel()
+
+
+MEASURE_LABELS = {
+    "DLCY": "Deposits LCY",
+    "DFCY": "Deposit FCY",
+    "DTOTAL": "Total Deposit",
+    "LLCY": "Lending LCY",
+    "LFCY": "Lending FCY",
+    "LTOTAL": "Total Lending",
+    "CD": "CD Ratio",
+}
+
+
+@timed_fragment
+def leaderboard_panel():
+    matrix, = load_datasets("bank_matrix")
+    month_ends = matrix.info
+
+    # Selector options in chronological order, defaulting to the full history
+    from_column, to_column = st.columns(2)
+    year_options = sorted(month_ends['Year'].unique().tolist())
+    month_options = periods.month_options(month_ends)
+    first_month, last_month = month_ends.iloc[0], month_ends.iloc[-1]
+    with from_column:
+        from_year = st.selectbox("From Year", year_options, index=year_options.index(first_month['Year']), key="leaderboard_from_year")
+        from_month = st.selectbox("From Month", month_options, index=month_options.index(first_month['Month']), key="leaderboard_from_month")
+    with to_column:
+        to_year = st.selectbox("To Year", year_options, index=year_options.index(last_month['Year']), key="leaderboard_to_year")
+        to_month = st.selectbox("To Month", month_options, index=month_options.index(last_month['Month']), key="leaderboard_to_month")
+
+    measure_column, sort_column = st.columns(2)
+    measure = measure_column.selectbox("Measure", list(MEASURE_LABELS), format_func=MEASURE_LABELS.get, index=2)
+    sort_by = sort_column.selectbox("Rank by", ["Change", "Change %", "Share Shift", "End"])
+
+    # Every bank and measure over the range in one pass; the table shows one measure
+    columns = matrix.columns(periods.month_span(from_year, from_month)[0], periods.month_span(to_year, to_month)[1])
+    changes = matrix.range_change(columns)
+    if changes.empty:
+        st.warning("No data in the selected range. Pick a \"From\" month before the \"To\" month.")
+        return
+    if measure == "CD" and sort_by == "Share Shift":
+        # A ratio has no market share
+        sort_by = "Change"
+    leaderboard = changes[changes["Measure"] == measure].sort_values(sort_by, ascending=False, na_position="last")
+    unit = "%%" if measure == "CD" else ""
+    show_table(
+        leaderboard,
+        key="leaderboard_table_page",
+        show_latest=False,
+        use_container_width=True,
+        column_config={
+            "Bank": "Bank Name",
+            "Start": st.column_config.NumberColumn("Start", format=f"%.2f{unit}"),
+            "End": st.column_config.NumberColumn("End", format=f"%.2f{unit}"),
+            "Change": st.column_config.NumberColumn("Change", format="%.2f"),
+            "Change %": st.column_config.NumberColumn("Change %", format="%.2f%%"),
+            "Share Start": st.column_config.NumberColumn("Share Start", format="%.2f%%"),
+            "Share End": st.column_config.NumberColumn("Share End", format="%.2f%%"),
+            "Share Shift": st.column_config.NumberColumn("Share Shift (pp)", format="%+.2f"),
+        },
+        column_order=["Bank", "Start", "End", "Change", "Change %"] + (["Share Start", "Share End", "Share Shift"] if measure != "CD" else []),
+    )
+
+
+with st.expander("Bank leaderboard", expanded=False):
+    leaderboard_panel()
+
+
+@timed_fragment
+def bank_panel():
+    matrix, = load_datasets("bank_matrix")
+    ind_bank_select=st.selectbox("Select a bank", options=matrix.banks.tolist())
+    ind_bank_df=matrix.bank_frame(ind_bank_select)
+    show_table(
+        ind_bank_df,
+        key="bank_table_page",
+        use_container_width=True,
+        column_config={
+            "Date": st.column_config.DateColumn("English Date"),
+            "Ndate":"Nepali Date",
+            "FY": "FY",
+            "Year": st.column_config.NumberColumn(
+                "Year",
+                format="%.0f"
+            ),
+            "Month": "Month",
+            "Week":"Week",
+
+            "DLCY": st.column_config.NumberColumn(
+                "Deposits LCY",
+                format="%.2f"
+            ),
+            "DFCY": st.column_config.NumberColumn(
+                "Deposit FCY",
+                format="%.2f"
+            ),
+            "DTOTAL": st.column_config.NumberColumn(
+                "Total Deposit",
+                format="%.2f"
+            ),
+            "LLCY": st.column_config.NumberColumn(
+                "Lending LCY",
+                format="%.2f"
+            ),
+            "LFCY": st.column_config.NumberColumn(
+                "Lending FCY",
+                format="%.2f"
+            ),
+            "LTOTAL": st.column_config.NumberColumn(
+                "Total Lending",
+                format="%.2f"
+            ),
+            "CD":st.column_config.NumberColumn(
+                "CD Ratio",
+                format="%.2f%%"
+
+            ),
+        },
+        column_order=["FY","Year","Month","Week","Date","Ndate","DLCY","DFCY","DTOTAL","LLCY","LFCY","LTOTAL","CD"]
+    )
+
+
+with st.expander("Individual Bank", expanded=True):
+    bank_panel()
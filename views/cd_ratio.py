@@ -0,0 +1,145 @@
+"""CD Ratio page: monthly and weekly credit-to-deposit ratio."""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from views.shared import cached_figure, load_datasets, plotly_chart, timed_fragment
+from views.tables import show_table
+
+new_df, month_df, week_df = load_datasets("periods", "months", "weeks")
+
+st.title("Credit to Deposit Ratio")
+
+# Create tabs for Monthly and Weekly data
+tab1, tab2 = st.tabs(["Monthly Data", "Weekly Data"])
+
+with tab1:
+    st.subheader("Monthly Data")
+
+    # Layout with two columns
+    col1, col2 = st.columns([1, 1.5])
+    latest_cd = new_df.iloc[-1]['CD'] 
+
+    with col1:
+        st.metric(label=f"As of {new_df['Description'].iloc[-1]} ({new_df['Ndate'].iloc[-1]})", value=f"{latest_cd:.2f}%")
+        # Newest first; a reversed view instead of a sorted copy
+        show_table(
+            month_df.iloc[::-1],
+            key="monthly_cd_table_page",
+            show_latest=False,
+            use_container_width=True,
+            height=447 ,
+            column_config={
+                "Date": st.column_config.DateColumn("English Date"),
+                "Ndate": "Nepali Date",
+                "FY": "FY",
+                "Year": st.column_config.NumberColumn(
+                    "Year",
+                    format="%.0f"
+                ),
+                "Month": "Month",
+                "CD": st.column_config.NumberColumn(
+                    "CD Ratio",
+                    format="%.2f%%"
+                ),
+            },
+            column_order=["FY", "Year", "Month", "CD"]
+        )
+
+    # Switching the fiscal year only reruns the chart
+    @timed_fragment
+    def monthly_cd_panel():
+        month_df, = load_datasets("month_analytics")
+        st.subheader("CD Ratio Over Time")
+        # Filter by Fiscal Year (FY)
+        selected_fy = st.selectbox("Select Fiscal Year", month_df["FY"].unique(), index=(len(month_df["FY"].unique())-1))
+        filtered_month_df_cd = month_df[month_df["FY"] == selected_fy]
+
+        # Latest month of the FY against the same month a year earlier, in percentage points
+        latest = filtered_month_df_cd.iloc[-1]
+        if pd.notna(latest["CD YoY"]):
+            st.metric(
+                label=f"{latest['Month']} vs the same month of the previous FY",
+                value=f"{latest['CD']:.2f}%",
+                delta=f"{latest['CD YoY']:.2f} pp",
+            )
+
+        def monthly_cd_chart():
+            fig_cd_ratio = px.line(
+                filtered_month_df_cd.rename(columns={"CD 3M Avg": "3-Month Average"}),
+                x="Month",
+                y=["CD", "3-Month Average"],
+                title=f"CD Ratio Over Time for FY {selected_fy}",
+                line_shape="spline",
+                markers=True
+            )
+            fig_cd_ratio.update_layout(xaxis_title="Date", yaxis_title="CD Ratio (%)", legend_title="")
+            return fig_cd_ratio
+
+        fig_cd_ratio = cached_figure("monthly_cd", (selected_fy,), monthly_cd_chart)
+        plotly_chart(fig_cd_ratio, use_container_width=True)
+
+    with col2:
+        monthly_cd_panel()
+
+with tab2:
+    st.subheader("Weekly Data")
+
+    # Layout with two columns
+    col1, col2 = st.columns([1, 1.5])
+    latest_cd = new_df.iloc[-1]['CD'] 
+
+    with col1:
+        st.metric(label=f"As of {new_df['Description'].iloc[-1]} ({new_df['Ndate'].iloc[-1]})", value=f"{latest_cd:.2f}%")
+        # Newest first; a reversed view instead of a sorted copy
+        show_table(
+            week_df.iloc[::-1],
+            key="weekly_cd_table_page",
+            show_latest=False,
+            use_container_width=True,
+            height=447,
+            column_config={
+                "Date": st.column_config.DateColumn("English Date"),
+                "Ndate": "Nepali Date",
+                "FY": "FY",
+                "Year": st.column_config.NumberColumn(
+                    "Year",
+                    format="%.0f"
+                ),
+                "Month": "Month",
+                "Week": "Week",
+                "CD": st.column_config.NumberColumn(
+                    "CD Ratio",
+                    format="%.2f%%"
+                ),
+            },
+            column_order=["FY", "Year", "Month", "Week", "CD"]
+        )
+
+    # Switching the fiscal year only reruns the chart
+    @timed_fragment
+    def weekly_cd_panel():
+        week_df, = load_datasets("weeks")
+        st.subheader("CD Ratio Over Time")
+        # Filter by Fiscal Year (FY)
+        selected_fy = st.selectbox("Select Fiscal Year", week_df["FY"].unique(), index=(len(week_df["FY"].unique())-1))
+
+        def weekly_cd_chart():
+            filtered_week_df_cd = week_df[week_df["FY"] == selected_fy]
+
+            fig_cd_ratio_week = px.line(
+                filtered_week_df_cd,
+                x="Description",
+                y="CD",
+                title=f"CD Ratio Over Time for FY {selected_fy}",
+                line_shape="spline",
+                markers=True
+            )
+            fig_cd_ratio_week.update_layout(xaxis_title="Week", yaxis_title="CD Ratio (%)")
+            return fig_cd_ratio_week
+
+        fig_cd_ratio_week = cached_figure("weekly_cd", (selected_fy,), weekly_cd_chart)
+        plotly_chart(fig_cd_ratio_week, use_container_width=True)
+
+    with col2:
+        weekly_cd_panel()
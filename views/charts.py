@@ -0,0 +1,85 @@
+"""Large-series rendering mode for the dashboard's Plotly figures.
+
+Long histories and many selected banks make figures that are slow to send
+and draw: every point is an SVG node, spline lines are recomputed on every
+hover, and per-point text labels pile up into an unreadable band.
+``large_series`` is applied to every figure as it is built, and only changes
+figures past these thresholds:
+
+- a line with more than ``MAX_POINTS`` points is downsampled with
+  ``dldata.downsample.lttb``, which keeps its peaks and turning points;
+- a figure with more than ``WEBGL_POINTS`` line points in all is drawn
+  with WebGL ``scattergl`` traces instead of SVG;
+- a figure with more than ``MAX_LABELS`` points or bars loses its
+  per-point text labels; the values stay in the hover.
+
+Small figures are returned untouched, so the regular charts look as before.
+"""
+import numpy as np
+import plotly.graph_objects as go
+
+from dldata.downsample import lttb
+
+MAX_POINTS = 500
+WEBGL_POINTS = 1000
+MAX_LABELS = 60
+
+
+def _positions(x: np.ndarray) -> np.ndarray:
+    """``x`` as numbers for ``lttb``; categories are spaced by their position."""
+    if x.dtype.kind in "iuf":
+        return x
+    if x.dtype.kind == "M":
+        return x.astype("datetime64[ns]").astype(np.int64)
+    return np.arange(len(x))
+
+
+def _downsample(trace, max_points: int) -> None:
+    x, y = np.asarray(trace.x), np.asarray(trace.y, dtype="float64")
+    keep = lttb(_positions(x), y, max_points)
+    updates = {"x": x[keep], "y": y[keep]}
+    # Per-point arrays have to follow the points that are kept
+    for name in ("text", "hovertext", "customdata"):
+        values = getattr(trace, name)
+        if values is not None and not isinstance(values, str) and len(values) == len(x):
+            updates[name] = np.asarray(values)[keep]
+    trace.update(updates)
+
+
+def _drop_labels(trace) -> None:
+    if trace.type == "bar":
+        trace.update(texttemplate=None, text=None, textposition="none")
+    elif trace.mode and "text" in trace.mode:
+        trace.update(mode=trace.mode.replace("+text", "").replace("text", "") or "lines", text=None)
+
+
+def large_series(figure: go.Figure, max_points: int = MAX_POINTS, webgl_points: int = WEBGL_POINTS,
+                 max_labels: int = MAX_LABELS) -> go.Figure:
+    """``figure`` adapted for large series, as described in the module docstring.
+
+    ``figure`` is changed in place, but use the returned figure: switching to
+    WebGL traces builds a new one.
+    """
+    # Plotly Express already draws frames of over 1000 rows with scattergl
+    lines = [trace for trace in figure.data if trace.type in ("scatter", "scattergl") and trace.y is not None]
+    points = sum(len(trace.y) for trace in figure.data if trace.y is not None)
+    if points > max_labels:
+        for trace in figure.data:
+            _drop_labels(trace)
+
+    long_lines = [trace for trace in lines if len(trace.y) > max_points]
+    if long_lines and any(np.asarray(trace.x).dtype.kind not in "iufM" for trace in long_lines):
+        # Traces that keep different categories would otherwise reorder the axis
+        categories = dict.fromkeys(value for trace in lines for value in trace.x)
+        figure.update_xaxes(categoryorder="array", categoryarray=list(categories))
+    for trace in long_lines:
+        _downsample(trace, max_points)
+
+    if sum(len(trace.y) for trace in lines) > webgl_points:
+        # scattergl has no spline lines or orientation; skip_invalid drops them
+        data = [
+            go.Scattergl(trace.to_plotly_json(), skip_invalid=True) if trace.type == "scatter" else trace
+            for trace in figure.data
+        ]
+        figure = go.Figure(data=data, layout=figure.layout)
+    return figure
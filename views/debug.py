@@ -0,0 +1,56 @@
+"""Opt-in sidebar panel with the timing spans of the last rerun.
+
+Open the dashboard with ``?debug=1`` to turn the panel on for the session.
+It lists the spans of the rerun that just finished, indented by nesting, and
+the rolling percentiles of every span across all sessions of this process,
+with a latency histogram of the span picked below them.
+Fragment reruns don't redraw the sidebar; their spans show up in the
+percentiles on the next full rerun.
+"""
+import pandas as pd
+import streamlit as st
+
+from dldata import timing
+
+SESSION_KEY = "debug_timings"
+
+
+def enabled() -> bool:
+    # Remember the opt-in, since switching pages drops the query parameter
+    if st.query_params.get("debug") in ("1", "true"):
+        st.session_state[SESSION_KEY] = True
+    return st.session_state.get(SESSION_KEY, False)
+
+
+def timing_panel(record: dict) -> None:
+    """Show ``record`` (from ``timing.rerun``) and the rolling percentiles."""
+    with st.sidebar.expander("Timings", expanded=True):
+        st.caption(f"{record['rerun']}: {record['ms']:.1f} ms")
+        spans = pd.DataFrame(record["spans"], columns=["name", "start_ms", "ms", "depth"])
+        spans["name"] = ["\u2003" * depth + name for name, depth in zip(spans["name"], spans["depth"])]
+        st.dataframe(
+            spans[["name", "start_ms", "ms"]],
+            hide_index=True,
+            column_config={
+                "name": "Span",
+                "start_ms": st.column_config.NumberColumn("Start ms", format="%.1f"),
+                "ms": st.column_config.NumberColumn("ms", format="%.2f"),
+            },
+        )
+
+        st.caption(f"Last {timing.TIMINGS.window} calls per span")
+        percentiles = pd.DataFrame.from_dict(timing.percentiles(), orient="index")
+        st.dataframe(
+            percentiles,
+            column_config={
+                "count": st.column_config.NumberColumn("Calls"),
+                **{c: st.column_config.NumberColumn(f"{c} ms", format="%.2f") for c in percentiles.columns if c != "count"},
+            },
+        )
+
+        histograms = timing.histograms()
+        if histograms:
+            name = st.selectbox("Histogram", list(histograms), key="debug_histogram_span")
+            labels = [f"\u2264{bound:g}" for bound in timing.BUCKETS_MS] + [f">{timing.BUCKETS_MS[-1]:g}"]
+            counts = pd.DataFrame({"ms": labels, "Calls": histograms[name]})
+            st.bar_chart(counts, x="ms", y="Calls", sort=False, height=200)
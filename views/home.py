@@ -0,0 +1,98 @@
+"""Home page: latest totals and the period-to-period comparison."""
+import streamlit as st
+
+from dldata import derive, periods
+from views import assets
+from views.shared import load_datasets, timed_fragment
+
+new_df, = load_datasets("periods")
+
+st.title("Deposit and Lending of Commercial Banks")
+st.subheader("This portal is being discontinued after Shrawan 2082. For latest data, please visit the NBA portal which is currently under Development.")
+st.header(f"As of {new_df['Description'].iloc[-1]} ({new_df['Ndate'].iloc[-1]})")
+st.write("Amounts in Rs (Billions)")
+st.write("Metrics are compared from previous week data")
+
+# Main Page metrics calculation
+latest_entry = new_df.iloc[-1]
+latest_change = derive.compare_range(new_df.tail(2), ['DTOTAL', 'LTOTAL'])
+delta_DTOTAL = latest_change.loc['DTOTAL', 'Change']
+delta_LTOTAL = latest_change.loc['LTOTAL', 'Change']
+
+# Display metrics in two rows with three columns each
+col1, col2 = st.columns(2)
+with col1:
+    st.metric(label="Total Deposits", value=f"{latest_entry['DTOTAL']:.2f}", delta=f"{delta_DTOTAL:.2f}")
+with col2:
+    st.metric(label="Total Lending", value=f"{latest_entry['LTOTAL']:.2f}", delta=f"{delta_LTOTAL:.2f}")
+
+
+with st.expander("Click here for Monthly PDF Report from NBA",expanded=False):
+    st.subheader("Latest Available Monthly PDF Reports")
+    st.markdown(assets.expandable_image(assets.REPORT_FILE, assets.REPORT_THUMBNAIL_WIDTH, "Latest monthly report"), unsafe_allow_html=True)
+    st.caption("Click the image to open it at full size.")
+
+# Changing the range only reruns this panel
+@timed_fragment
+def comparison_panel():
+    new_df, = load_datasets("periods")
+    # Layout with two columns for date range selection
+    col_from, col_to = st.columns(2)
+
+    # Get the first and last entries of new_df
+    first_entry = new_df.iloc[0]
+    last_entry = new_df.iloc[-1]
+
+    # Selector options in chronological order
+    year_options = sorted(new_df['Year'].unique().tolist())
+    month_options = periods.month_options(new_df)
+    week_options = periods.week_options(new_df)
+
+    # From Year, Month, and Week selection
+    with col_from:
+        from_year_new = st.selectbox("From Year", year_options, index=year_options.index(first_entry['Year']), key="from_year_new")
+        from_month_new = st.selectbox("From Month", month_options, index=month_options.index(first_entry['Month']), key="from_month_new")
+        from_week_new = st.selectbox("From Week", week_options, index=week_options.index(first_entry['Week']), key="from_week_new")
+
+    # To Year, Month, and Week selection
+    with col_to:
+        to_year_new = st.selectbox("To Year", year_options, index=year_options.index(last_entry['Year']), key="to_year_new")
+        to_month_new = st.selectbox("To Month", month_options, index=month_options.index(last_entry['Month']), key="to_month_new")
+        to_week_new = st.selectbox("To Week", week_options, index=week_options.index(last_entry['Week']), key="to_week_new")
+
+    # Filter the dataframe based on the selected date range
+    filtered_df_new = derive.select_range(
+        new_df,
+        periods.period_key(from_year_new, from_month_new, from_week_new),
+        periods.period_key(to_year_new, to_month_new, to_week_new),
+    )
+
+    if filtered_df_new.empty:
+        st.warning("No data in the selected range. Pick a \"From\" period before the \"To\" period.")
+        return
+
+    # Calculate percentage and value changes
+    comparison = derive.compare_range(filtered_df_new, ['DTOTAL', 'LTOTAL', 'CD'])
+
+    # Layout for displaying metrics in three columns
+
+    metric_col1, metric_col2, metric_col3 = st.columns([1, 1, 1])
+
+    # Row 1: "From" data
+    metric_col1.metric(label="Starting Deposit", value=f"{comparison.loc['DTOTAL', 'Start']:.2f}")
+    metric_col2.metric(label="Starting Lending", value=f"{comparison.loc['LTOTAL', 'Start']:.2f}")
+    metric_col3.metric(label="Starting CD", value=f"{comparison.loc['CD', 'Start']:.2f}%")
+
+    # Row 2: "To" data
+    metric_col1.metric(label="Ending Deposit", value=f"{comparison.loc['DTOTAL', 'End']:.2f}")
+    metric_col2.metric(label="Ending Lending", value=f"{comparison.loc['LTOTAL', 'End']:.2f}")
+    metric_col3.metric(label="Ending CD", value=f"{comparison.loc['CD', 'End']:.2f}%")
+
+    # Row 3: "Change" data
+    metric_col1.metric(label="Deposit Change", value=f"{comparison.loc['DTOTAL', 'Change']:.2f}", delta=f"{comparison.loc['DTOTAL', 'Change %']:.2f}%")
+    metric_col2.metric(label="Lending Change", value=f"{comparison.loc['LTOTAL', 'Change']:.2f}", delta=f"{comparison.loc['LTOTAL', 'Change %']:.2f}%")
+    metric_col3.metric(label="CD Change", value=f"{comparison.loc['CD', 'Change']:.2f}", delta=f"{comparison.loc['CD', 'Change %']:.2f}%")
+
+
+with st.expander("DL Data Comparison", expanded=False):
+    comparison_panel()
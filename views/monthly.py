@@ -0,0 +1,295 @@
+"""Monthly page: deposit/lending trends and monthly growth by fiscal year."""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from dldata import derive, periods
+from views.shared import cached_figure, load_datasets, plotly_chart, timed_fragment
+from views.tables import show_table
+
+st.title("Monthly Data")
+
+# Each panel reruns on its own when its selectors change
+@timed_fragment
+def trend_panel():
+    month_df, = load_datasets("months")
+
+    # Layout with two columns for date range selection
+    from_column, to_column = st.columns(2)
+
+    # Selector options in chronological order, defaulting to the full history
+    year_options = sorted(month_df['Year'].unique().tolist())
+    month_options = periods.month_options(month_df)
+    first_month, last_month = month_df.iloc[0], month_df.iloc[-1]
+
+    # From Year and Month selection
+    with from_column:
+        from_year_m = st.selectbox("From Year", year_options, index=year_options.index(first_month['Year']))
+        from_month_m = st.selectbox("From Month", month_options, index=month_options.index(first_month['Month']))
+
+    # To Year and Month selection
+    with to_column:
+        to_year_m = st.selectbox("To Year", year_options, index=year_options.index(last_month['Year']))
+        to_month_m = st.selectbox("To Month", month_options, index=month_options.index(last_month['Month']))
+
+    # Filter the dataframe based on the selected date range
+    month_range = (periods.month_span(from_year_m, from_month_m)[0], periods.month_span(to_year_m, to_month_m)[1])
+    filtered_df_monthly = derive.select_range(month_df, *month_range)
+
+    # Layout with two columns for displaying data
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Total Deposit Trend")
+        def deposit_trend_chart():
+            fig_deposit = px.line(
+                filtered_df_monthly,
+                x="Yearmonth",
+                y="DTOTAL",
+                labels={"DTOTAL": "Total Deposit", "Date": "Date"},
+                line_shape="spline",
+                markers=True
+            )
+            fig_deposit.update_layout(xaxis_title="Date", yaxis_title="Amount in Billions")
+            return fig_deposit
+
+        fig_deposit = cached_figure("monthly_deposit_trend", month_range, deposit_trend_chart)
+        plotly_chart(fig_deposit, use_container_width=True)
+
+    with col2:
+        st.subheader("Total Lending Trend")
+        def lending_trend_chart():
+            fig_lending = px.line(
+                filtered_df_monthly,
+                x="Yearmonth",
+                y="LTOTAL",
+                labels={"LTOTAL": "Total Lending", "Date": "Date"},
+                line_shape="spline",
+                markers=True
+            )
+            fig_lending.update_layout(xaxis_title="Date", yaxis_title="Amount in Billions")
+            return fig_lending
+
+        fig_lending = cached_figure("monthly_lending_trend", month_range, lending_trend_chart)
+        plotly_chart(fig_lending, use_container_width=True)
+
+
+trend_panel()
+
+st.header("Monthly Growth Comparison (Amount)")
+
+@timed_fragment
+def growth_amount_panel():
+    month_analytics, fiscal_year_df = load_datasets("month_analytics", "fiscal_years")
+    fiscal_years = fiscal_year_df["FY"].tolist()
+
+    # Add dropdown for selecting a fiscal year for the bar chart
+    selected_fy_for_bar = st.selectbox("Select Fiscal Year for Bar Chart", fiscal_years, index=len(fiscal_years)-1)
+
+    def monthly_growth_chart():
+        # Growth for deposits and loans within the selected fiscal year
+        filtered_month_df_bar = month_analytics[month_analytics['FY'] == selected_fy_for_bar]
+
+        # Melt the DataFrame for the grouped bar chart
+        df_melted = derive.growth_long(filtered_month_df_bar, 'Month', derive.CHANGE_LABELS)
+
+        fig = px.bar(
+            df_melted,
+            x='Month',
+            y='Growth',
+            color='Total Type',
+            barmode='group',
+            title='Monthly Deposits and Loans Growth Over Time',
+            text_auto=True
+        )
+
+        fig.update_layout(
+            xaxis_title="Month",
+            yaxis_title="Amount in Billions",
+            legend=dict(
+                title="",
+                orientation="h",
+                y=1.1,
+                yanchor="bottom",
+                x=0.5,
+                xanchor="center",
+                font=dict(
+                    size=12,
+                    color="black"
+                )
+            )
+        )
+        return fig
+
+    fig = cached_figure("monthly_growth", (selected_fy_for_bar,), monthly_growth_chart)
+    plotly_chart(fig, use_container_width=True)
+
+
+growth_amount_panel()
+
+st.header("Monthly Growth Comparison (Percentage)")
+
+@timed_fragment
+def growth_percentage_panel():
+    month_analytics, fiscal_year_df = load_datasets("month_analytics", "fiscal_years")
+    fiscal_years = fiscal_year_df["FY"].tolist()
+
+    # Add multiselect for selecting fiscal years for the line charts
+    selected_fys_for_line = st.multiselect("Select Fiscal Years for Line Charts", fiscal_years, default=fiscal_years[1])
+
+    # Percentage change for DTOTAL and LTOTAL within the selected fiscal years
+    filtered_month_df_line = month_analytics[month_analytics['FY'].isin(selected_fys_for_line)]
+    if not filtered_month_df_line.empty:
+        col1, col2 = st.columns(2)
+        with col1:
+            # Line chart for DTOTAL
+            st.subheader("Monthly Deposit Growth")
+            def deposit_growth_chart():
+                fig_dtotal = px.line(
+                    filtered_month_df_line,
+                    x="Month",
+                    y="DTOTAL Change %",
+                    color='FY',
+                    line_shape="spline",
+                    markers=True,
+                    text="DTOTAL Change %"  # Display the values as text
+                )
+                fig_dtotal.update_layout(xaxis_title="",yaxis_title="%(Percentage)")
+                fig_dtotal.update_traces(textposition="middle right", texttemplate='%{text:.2f}%')
+                return fig_dtotal
+
+            fig_dtotal = cached_figure("monthly_deposit_growth", tuple(selected_fys_for_line), deposit_growth_chart)
+            plotly_chart(fig_dtotal, use_container_width=True)
+
+        with col2:
+            # Line chart for LTOTAL
+            st.subheader("Monthly Lending Growth")
+            def lending_growth_chart():
+                fig_ltotal = px.line(
+                    filtered_month_df_line,
+                    x="Month",
+                    y="LTOTAL Change %",
+                    color='FY',
+                    line_shape="spline",
+                    markers=True,
+                    text="LTOTAL Change %"  # Display the values as text
+                )
+                fig_ltotal.update_layout(xaxis_title="",yaxis_title="%(Percentage)")
+                fig_ltotal.update_traces(textposition="middle right", texttemplate='%{text:.2f}%')
+                return fig_ltotal
+
+            fig_ltotal = cached_figure("monthly_lending_growth", tuple(selected_fys_for_line), lending_growth_chart)
+            plotly_chart(fig_ltotal, use_container_width=True)
+    else:
+        st.write("No data available to display.")
+    show_table(
+        filtered_month_df_line,
+        key="monthly_table_page",
+        use_container_width=True,
+            column_config={
+                "Date": st.column_config.DateColumn("English Date"),
+                "Ndate":"Nepali Date",
+                "FY": "FY",
+                "Year": st.column_config.NumberColumn(
+                    "Year",
+                    format="%.0f"
+                ),
+                "Month": "Month",
+
+                "DLCY": st.column_config.NumberColumn(
+                    "Deposits LCY",
+                    format="%.2f"
+                ),
+                "DFCY": st.column_config.NumberColumn(
+                    "Deposit FCY",
+                    format="%.2f"
+                ),
+                "DTOTAL": st.column_config.NumberColumn(
+                    "Total Deposit",
+                    format="%.2f"
+                ),
+                "LLCY": st.column_config.NumberColumn(
+                    "Lending LCY",
+                    format="%.2f"
+                ),
+                "LFCY": st.column_config.NumberColumn(
+                    "Lending FCY",
+                    format="%.2f"
+                ),
+                "LTOTAL": st.column_config.NumberColumn(
+                    "Total Lending",
+                    format="%.2f"
+                ),
+                "CD":st.column_config.NumberColumn(
+                    "CD Ratio",
+                    format="%.2f%%"
+
+                ),
+                "DTOTAL Change %":st.column_config.NumberColumn(
+                    "Deposit Growth",
+                    format="%.2f%%"
+                ),
+                "LTOTAL Change %":st.column_config.NumberColumn(
+                    "Lending Growth",
+                    format="%.2f%%"
+                ),
+            },
+             column_order=["FY","Year","Month","Week","Date","Ndate","DTOTAL","LTOTAL","CD","DTOTAL Change %","LTOTAL Change %"]  
+        )
+
+
+growth_percentage_panel()
+
+st.header("Fiscal Year to Date and Year over Year")
+
+FYTD_MEASURES = {"DTOTAL": "Total Deposit", "LTOTAL": "Total Lending", "CD": "CD Ratio"}
+ALL_BANKS = "All banks"
+
+@timed_fragment
+def fytd_panel():
+    month_analytics, bank_month_analytics = load_datasets("month_analytics", "bank_month_analytics")
+
+    bank_column, measure_column = st.columns(2)
+    with bank_column:
+        bank_options = [ALL_BANKS] + sorted(bank_month_analytics["Bank"].unique().tolist())
+        selected_bank = st.selectbox("Bank", bank_options, key="fytd_bank")
+    with measure_column:
+        measure = st.selectbox("Measure", list(FYTD_MEASURES), format_func=FYTD_MEASURES.get, key="fytd_measure")
+
+    if selected_bank == ALL_BANKS:
+        analytics_df = month_analytics
+    else:
+        analytics_df = bank_month_analytics[bank_month_analytics["Bank"] == selected_bank]
+
+    # The CD ratio is already a percentage, so it's compared in percentage points
+    unit = "pp" if measure == "CD" else "%"
+    fytd_column = f"{measure} FYTD" if measure == "CD" else f"{measure} FYTD %"
+    yoy_column = f"{measure} YoY" if measure == "CD" else f"{measure} YoY %"
+
+    def formatted(value, suffix=""):
+        return "n/a" if pd.isna(value) else f"{value:.2f}{suffix}"
+
+    latest = analytics_df.iloc[-1]
+    col1, col2, col3 = st.columns(3)
+    col1.metric(f"Fiscal YTD ({latest['FY']})", formatted(latest[fytd_column], unit))
+    col2.metric(f"Year over Year ({latest['Month']})", formatted(latest[yoy_column], unit))
+    col3.metric("12-Month Average", formatted(latest[f"{measure} 12M Avg"]))
+
+    def fytd_chart():
+        fig = px.line(
+            analytics_df,
+            x="Month",
+            y=fytd_column,
+            color="FY",
+            line_shape="spline",
+            markers=True,
+            title=f"Fiscal Year to Date Change in {FYTD_MEASURES[measure]} ({selected_bank})",
+        )
+        fig.update_layout(xaxis_title="", yaxis_title=f"Change since the close of the previous FY ({unit})")
+        return fig
+
+    fig = cached_figure("monthly_fytd", (selected_bank, measure), fytd_chart)
+    plotly_chart(fig, use_container_width=True)
+
+
+fytd_panel()
@@ -0,0 +1,88 @@
+"""Search page: filter periods through the inverted search index."""
+import streamlit as st
+
+from views.shared import load_datasets
+from views.tables import show_table
+
+new_df, search_index = load_datasets("periods", "search_index")
+
+st.title("Search Data")
+st.markdown("""
+
+Enter a keyword in the search box below to filter the data based on the description. You can use partial or full words to search. For example:
+
+- To find entries for a specific year, type the year, either in Nepali or English Date format(e.g., '2023' or '2081').
+- To find entries for a specific month, type the month (e.g., 'January' or 'Jan', or 'Baisakh'). Other spellings such as 'Baishakh' work too.
+- To find entries for a specific year and month, type both (e.g.'2081 Baisakh').
+- To find entries for a specific year and month and week, type ('2081 Baisakh 1st Week' or '2081 Shrawan 3rd Week').
+- Or just simply enter the date (e.g. '2024-07-24' or '3/7/2081')
+
+Note: The search is case-insensitive.
+""")
+
+search_filter = st.text_input("Search by Description")
+if search_filter:
+    suggestions = search_index.suggest(search_filter)
+    if suggestions:
+        st.caption("Suggestions: " + " · ".join(suggestions))
+    filtered_df = new_df.iloc[search_index.search(search_filter)]
+    show_table(
+        filtered_df,
+        key="search_table_page",
+        # Open on the first matches, not the last page like the period tables
+        show_latest=False,
+        use_container_width=True,
+        column_config={
+            "Date": st.column_config.DateColumn("English Date"),
+            "Ndate":"Nepali Date", 
+            "FY": "FY",
+            "Year": st.column_config.NumberColumn(
+                "Year",
+                format="%.0f"
+            ),
+            "Month": "Month",
+            "Week":"Week",
+            "DTOTAL Growth":"Deposit Growth",
+            "LTOTAL Growth":"Lending Growth",
+
+            "DLCY": st.column_config.NumberColumn(
+                "Deposits LCY",
+                format="%.2f"
+            ),
+            "DFCY": st.column_config.NumberColumn(
+                "Deposit FCY",
+                format="%.2f"
+            ),
+            "DTOTAL": st.column_config.NumberColumn(
+                "Total Deposit",
+                format="%.2f"
+            ),
+            "LLCY": st.column_config.NumberColumn(
+                "Lending LCY",
+                format="%.2f"
+            ),
+            "LFCY": st.column_config.NumberColumn(
+                "Lending FCY",
+                format="%.2f"
+            ),
+            "LTOTAL": st.column_config.NumberColumn(
+                "Total Lending",
+                format="%.2f"
+            ),
+            "CD":st.column_config.NumberColumn(
+                "CD Ratio",
+                format="%.2f%%"
+
+            ),
+        },
+        column_order=["FY","Year","Month","Week","Date","Ndate","DTOTAL","LTOTAL","CD","DTOTAL Growth","LTOTAL Growth"]     
+
+        )
+else:
+    st.write("Enter a search term to filter the data.")
+        # Description for search functionality
+
+
+
+
+
@@ -0,0 +1,247 @@
+"""Datasets and the figure cache shared by the dashboard pages.
+
+Every dataset is built on first use and cached once per data version, so a
+page only pays for the datasets it asks for. Datasets published for the
+version by ``python -m dldata.publish`` are memory-mapped instead of built,
+and shared with the other worker processes. The cached frames are shared by
+all sessions and must be treated as read-only.
+
+The data version comes from a ``dldata.watcher.DataWatcher``, which builds
+every dataset of a new version in the background before making it current.
+Each rerun reads the version once (see ``pinned_version``), so it sees one
+consistent version even if a new one goes live halfway through. A rerun
+whose version has to be built after its source has changed again waits for
+the watcher to make the new version current and is restarted on it, since
+nothing is cached under a version it wasn't read as.
+
+Figures built through ``cached_figure`` go through the large-series mode of
+``views.charts``, which downsamples long lines, switches big figures to WebGL
+and drops unreadable labels. Dataset lookups, figure builds, ``plotly_chart``
+calls and ``timed_fragment`` reruns are recorded as ``dldata.timing`` spans,
+and dataset and figure cache hits and misses are counted in ``dldata.metrics``.
+"""
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+
+import dldata
+from dldata import BankMatrix, SearchIndex, analytics, cube, metrics, publish, store, timing
+from dldata.figure_cache import FigureCache
+from dldata.source import StaleVersionError
+from dldata.watcher import DataWatcher
+from views.charts import large_series
+
+# How long a rerun whose version went stale waits for the next one, and how often it looks
+STALE_WAIT = 30.0
+STALE_POLL = 0.2
+
+# Datasets built by the current thread's lookup
+_builds = threading.local()
+# Data version pinned for the current thread's rerun
+_pinned = threading.local()
+
+
+def _build(name: str, version: str, build):
+    """The published ``name`` frame (see ``dldata.publish``) if there is one, else ``build()``."""
+    # Called from inside the cached builders, so only on a cache miss
+    metrics.inc("dldata_cache_misses_total", cache="dataset", name=name)
+    getattr(_builds, "names", set()).add(name)
+    published = publish.read_dataset(name, version)
+    return published if published is not None else build()
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _banks(version: str):
+    return _build("banks", version, lambda: cube.build_banks(dldata.load_data(dldata.data_source(), version)))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _periods(version: str):
+    def build():
+        source = dldata.data_source()
+        if store.is_store(source):
+            # The store keeps each fiscal year's period totals; no need to regroup the bank rows
+            return store.read_periods(source, version)
+        return cube.build_periods(_banks(version))
+
+    return _build("periods", version, build)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _months(version: str):
+    return _build("months", version, lambda: cube.build_months(_periods(version)))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _month_analytics(version: str):
+    return _build("month_analytics", version, lambda: analytics.month_analytics(_months(version)))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _weeks(version: str):
+    return _build("weeks", version, lambda: cube.build_weeks(_periods(version)))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _bank_months(version: str):
+    return _build("bank_months", version, lambda: cube.build_bank_months(_banks(version)))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _bank_month_analytics(version: str):
+    return _build("bank_month_analytics", version, lambda: analytics.month_analytics(_bank_months(version), group="Bank"))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _bank_matrix(version: str):
+    return _build("bank_matrix", version, lambda: BankMatrix.build(_bank_months(version)))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _fiscal_years(version: str):
+    return _build("fiscal_years", version, lambda: cube.build_fiscal_years(_months(version)))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _search_index(version: str):
+    return _build("search_index", version, lambda: SearchIndex.build(_periods(version)))
+
+
+DATASETS = {
+    "banks": _banks,
+    "periods": _periods,
+    "months": _months,
+    "month_analytics": _month_analytics,
+    "weeks": _weeks,
+    "bank_months": _bank_months,
+    "bank_month_analytics": _bank_month_analytics,
+    "bank_matrix": _bank_matrix,
+    "fiscal_years": _fiscal_years,
+    "search_index": _search_index,
+}
+
+
+def _prepare(version: str) -> None:
+    # Build every dataset of a new version before the watcher makes it current
+    for name, dataset in DATASETS.items():
+        with timing.span(f"prepare:{name}"):
+            dataset(version)
+
+
+def _swapped(previous: str, version: str) -> None:
+    # Reruns pinned to the previous version can still ask for its figures; the
+    # dataset caches keep the same two versions
+    get_figure_cache().keep_versions(previous, version)
+
+
+@st.cache_resource(show_spinner=False)
+def get_watcher() -> DataWatcher:
+    return DataWatcher(_prepare, on_swap=_swapped).start()
+
+
+def data_version() -> str:
+    """The rerun's pinned data version, or the newest built one outside a rerun."""
+    return getattr(_pinned, "version", None) or get_watcher().version
+
+
+@contextmanager
+def pinned_version():
+    """Use one data version for every lookup of the block, like a rerun."""
+    if getattr(_pinned, "version", None) is not None:
+        # A fragment running inside a full rerun keeps the rerun's version
+        yield _pinned.version
+        return
+    _pinned.version = get_watcher().version
+    try:
+        yield _pinned.version
+    finally:
+        _pinned.version = None
+
+
+def _wait_for_new_version(version: str, timeout: float = STALE_WAIT) -> bool:
+    """Wait for the watcher to move past ``version``; False if it hasn't after ``timeout`` seconds.
+
+    The new version is built by the watcher's thread, not by this rerun.
+    """
+    watcher = get_watcher()
+    deadline = time.monotonic() + timeout
+    with st.spinner("Loading the latest data..."):
+        while watcher.version == version:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(STALE_POLL)
+    return True
+
+
+def load_datasets(*names: str) -> tuple:
+    """The named datasets for the current data version, built if needed."""
+    version = data_version()
+    datasets = []
+    for name in names:
+        _builds.names = set()
+        with timing.span(f"dataset:{name}"):
+            try:
+                datasets.append(DATASETS[name](version))
+            except StaleVersionError:
+                # The source moved on before this version's dataset was built
+                if _wait_for_new_version(version):
+                    st.rerun()
+                raise
+        if name not in _builds.names:
+            metrics.inc("dldata_cache_hits_total", cache="dataset", name=name)
+    return tuple(datasets)
+
+
+@st.cache_resource(show_spinner=False)
+def get_figure_cache() -> FigureCache:
+    cache = FigureCache(maxsize=256)
+    metrics.add_collector(lambda: [("dldata_cache_entries", {"cache": "figure"}, cache.stats()["size"])])
+    return cache
+
+
+def cached_figure(chart_id: str, params: tuple, build):
+    # Rebuild a chart only when the data or the chart's own selections change
+    built = False
+
+    def timed_build():
+        nonlocal built
+        built = True
+        with timing.span(f"figure:{chart_id}"):
+            return large_series(build())
+
+    figure = get_figure_cache().get_or_build((data_version(), chart_id) + params, timed_build)
+    metrics.inc("dldata_cache_misses_total" if built else "dldata_cache_hits_total", cache="figure", name=chart_id)
+    return figure
+
+
+def plotly_chart(figure, **kwargs):
+    """``st.plotly_chart``, timed; most of its cost is serializing the figure."""
+    with timing.span("st.plotly_chart"):
+        return st.plotly_chart(figure, **kwargs)
+
+
+def timed_fragment(fn):
+    """``st.fragment`` whose reruns are timed and pinned to a data version like a page rerun."""
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        with timing.rerun(f"fragment:{fn.__name__}"), pinned_version():
+            return fn(*args, **kwargs)
+    return st.fragment(run)
+
+
+def _session_samples():
+    from streamlit.runtime import Runtime
+
+    if Runtime.exists():
+        # The session manager has no public accessor on the runtime
+        yield "dldata_active_sessions", {}, Runtime.instance()._session_mgr.num_active_sessions()
+
+
+@st.cache_resource(show_spinner=False)
+def start_metrics_server():
+    """Serve ``/metrics`` once per process when ``DLDATA_METRICS_PORT`` is set."""
+    metrics.add_collector(_session_samples)
+    return metrics.serve_from_env()
@@ -0,0 +1,66 @@
+"""Tables that send only what is on screen.
+
+``st.dataframe`` serializes every column of the frame it is given, including
+the ones hidden through ``column_config``, and every row, however long the
+history. ``show_table`` cuts the frame down to its visible columns and to one
+page of rows before it is sent, and computes growth columns for that page
+only.
+"""
+import math
+
+import pandas as pd
+import streamlit as st
+
+from dldata import derive, timing
+
+# About a year of weekly rows
+PAGE_SIZE = 52
+
+
+def page_rows(total: int, page: int, page_size: int = PAGE_SIZE) -> slice:
+    """Positions of the rows on 1-based ``page``."""
+    start = (page - 1) * page_size
+    return slice(start, min(start + page_size, total))
+
+
+def show_table(
+    frame: pd.DataFrame,
+    column_order: list,
+    column_config: dict = None,
+    key: str = None,
+    page_size: int = PAGE_SIZE,
+    show_latest: bool = True,
+    growth: dict = None,
+    **kwargs,
+):
+    """Show the ``column_order`` columns of ``frame`` a page at a time.
+
+    Tables longer than ``page_size`` get a page selector, starting on the
+    page with the frame's last rows when ``show_latest`` is set. ``growth``
+    holds ``derive.growth`` arguments for ``<column> Growth`` columns, which
+    are added for the shown rows only. Other keyword arguments go to
+    ``st.dataframe``.
+    """
+    pages = max(math.ceil(len(frame) / page_size), 1)
+    page = pages if show_latest else 1
+    if pages > 1:
+        page_column, caption_column = st.columns([1, 4], vertical_alignment="bottom")
+        page = page_column.number_input("Page", min_value=1, max_value=pages, value=page, key=key)
+    rows = page_rows(len(frame), page, page_size)
+    if pages > 1:
+        caption_column.caption(f"Rows {rows.start + 1}-{rows.stop} of {len(frame)}")
+
+    if growth is not None:
+        shown = derive.growth_window(frame, rows, **growth)
+    else:
+        shown = frame.iloc[rows]
+    shown = shown[[c for c in column_order if c in shown.columns]]
+
+    with timing.span("st.dataframe"):
+        st.dataframe(
+            shown,
+            hide_index=True,
+            column_config=column_config,
+            column_order=column_order,
+            **kwargs,
+        )
@@ -0,0 +1,112 @@
+"""Weekly page: week-on-week growth and the weekly totals table."""
+import plotly.express as px
+import streamlit as st
+
+from dldata import derive
+from views.shared import cached_figure, load_datasets, plotly_chart, timed_fragment
+from views.tables import show_table
+
+week_df, = load_datasets("weeks")
+
+st.title("Weekly Data")
+
+# Moving the slider only reruns the chart
+@timed_fragment
+def growth_panel():
+    week_df, = load_datasets("weeks")
+
+    # Add a slider to select the number of weeks to display
+    num_weeks = st.slider("Select Number of Weeks", min_value=1, max_value=len(week_df), value=5)
+
+    def weekly_growth_chart():
+        # Show only the selected number of weeks
+        week_df_last_n = derive.growth_window(week_df, slice(-num_weeks, None))
+
+        # Melt the DataFrame and rename the values in the 'Total Type' column
+        df_melted = derive.growth_long(week_df_last_n, 'Description')
+
+        fig = px.bar(
+            df_melted,
+            x='Description',
+            y='Growth',
+            color='Total Type',
+            barmode='group',
+            title=f'Weekly Deposits and Loans Growth Over Time (Last {num_weeks} Data Points)',
+            text_auto=True
+        )
+
+        fig.update_layout(
+            xaxis_title="Month and Week",
+            yaxis_title="Growth",
+            legend=dict(
+                title="",
+                orientation="h",
+                y=1.1,
+                yanchor="bottom",
+                x=0.5,
+                xanchor="center",
+                font=dict(
+                    size=12,
+                    color="black"
+                )
+            )
+        )
+        return fig
+
+    fig = cached_figure("weekly_growth", (num_weeks,), weekly_growth_chart)
+    plotly_chart(fig, use_container_width=True)
+
+
+growth_panel()
+
+show_table(
+    week_df,
+    key="weekly_table_page",
+    growth={"columns": ("DTOTAL", "LTOTAL")},
+    use_container_width=True,
+    column_config={
+            "Date": st.column_config.DateColumn("English Date"),
+            "Ndate":"Nepali Date", 
+            "FY": "FY",
+            "Year": st.column_config.NumberColumn(
+                "Year",
+                format="%.0f"
+            ),
+            "Month": "Month",
+            "Week":"Week",
+            "DTOTAL Growth":"Deposit Growth",
+            "LTOTAL Growth":"Lending Growth",
+
+            "DLCY": st.column_config.NumberColumn(
+                "Deposits LCY",
+                format="%.2f"
+            ),
+            "DFCY": st.column_config.NumberColumn(
+                "Deposit FCY",
+                format="%.2f"
+            ),
+            "DTOTAL": st.column_config.NumberColumn(
+                "Total Deposit",
+                format="%.2f"
+            ),
+            "LLCY": st.column_config.NumberColumn(
+                "Lending LCY",
+                format="%.2f"
+            ),
+            "LFCY": st.column_config.NumberColumn(
+                "Lending FCY",
+                format="%.2f"
+            ),
+            "LTOTAL": st.column_config.NumberColumn(
+                "Total Lending",
+                format="%.2f"
+            ),
+            "CD":st.column_config.NumberColumn(
+                "CD Ratio",
+                format="%.2f%%"
+
+            ),
+        },
+        column_order=["FY","Year","Month","Week","Date","Ndate","DTOTAL","LTOTAL","CD","DTOTAL Growth","LTOTAL Growth"]
+    )
+